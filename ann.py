@@ -0,0 +1,137 @@
+import time
+
+import numpy as np
+
+# Approximate candidate search for very large symptom indexes: random-hyperplane
+# LSH (SimHash). Each table hashes a vector to the signs of `bits` random
+# projections, so vectors at a small angle tend to share a bucket. A query's
+# candidates are the union of its buckets over all tables (with probes=1 also
+# the buckets one bit away), and only those rows get scored exactly.
+
+class LSHIndex:
+    def __init__(self, tables=8, bits=12, probes=0, seed=0):
+        self.tables = tables
+        self.bits = bits
+        self.probes = probes
+        self.seed = seed
+        self.planes = None
+
+    def fit(self, matrix):
+        rng = np.random.default_rng(self.seed)
+        # (terms x tables*bits), so a sparse query only gathers its own rows
+        self.planes = rng.standard_normal((self.tables * self.bits, matrix.shape[1])).astype(np.float32).T.copy()
+        codes = np.zeros((matrix.shape[0], self.tables), dtype=np.uint64)
+        for start in range(0, matrix.shape[0], 8192):
+            block = matrix[start:start + 8192]
+            codes[start:start + block.shape[0]] = self._pack(np.asarray(block @ self.planes))
+        # every table's buckets in one sorted key space: table << bits | code
+        keys = (codes + self._offsets()).ravel()
+        self.order = np.argsort(keys, kind="stable")
+        self.keys, self.starts = np.unique(keys[self.order], return_index=True)
+        self.ends = np.append(self.starts[1:], len(self.order))
+        self.order //= self.tables
+        return self
+
+    def _offsets(self):
+        return np.arange(self.tables, dtype=np.uint64) << np.uint64(self.bits)
+
+    def _pack(self, proj):
+        signs = (proj.reshape(len(proj), -1, self.bits) > 0).astype(np.uint64)
+        return (signs << np.arange(self.bits, dtype=np.uint64)).sum(axis=2, dtype=np.uint64)
+
+    def codes(self, qvec):
+        nz = np.flatnonzero(qvec[:self.planes.shape[0]])
+        proj = qvec[nz] @ self.planes[nz]
+        return self._pack(proj.reshape(1, -1))[0]
+
+    # bucket keys to visit: each table's code, plus one-bit flips if probing
+    def probe_keys(self, qvec, tables=None):
+        tables = self.tables if tables is None else tables
+        keys = (self.codes(qvec) + self._offsets())[:tables, None]
+        if self.probes:
+            flips = np.uint64(1) << np.arange(self.bits, dtype=np.uint64)
+            keys = np.hstack([keys, keys ^ flips])
+        return keys
+
+    # rows in the given buckets; a row sits in one bucket per table, so rows
+    # from a single table's keys come back without repeats
+    def rows(self, keys):
+        keys = keys.ravel()
+        i = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        i = i[self.keys[i] == keys]
+        lens = self.ends[i] - self.starts[i]
+        pos = np.repeat(self.starts[i] - np.cumsum(lens) + lens, lens) + np.arange(lens.sum())
+        return self.order[pos]
+
+    def candidates(self, qvec):
+        return np.unique(self.rows(self.probe_keys(qvec)))
+
+    # fraction of queries whose exact best row is among the candidates
+    def recall(self, matrix, qvecs):
+        hits = 0
+        for q in qvecs:
+            scores = matrix @ q
+            best = np.flatnonzero(scores == scores.max())
+            hits += bool(np.intersect1d(best, self.candidates(q)).size)
+        return hits / max(1, len(qvecs))
+
+# partial symptom lists drawn from the indexed rows: a random `keep` share of
+# one row's terms, renormalized
+def sample_queries(matrix, n=200, keep=0.5, seed=0):
+    rng = np.random.default_rng(seed)
+    qvecs = []
+    for row in rng.integers(0, matrix.shape[0], size=n):
+        a, b = matrix.indptr[row], matrix.indptr[row + 1]
+        if a == b:
+            continue
+        pick = rng.choice(np.arange(a, b), size=max(1, int(round((b - a) * keep))), replace=False)
+        q = np.zeros(matrix.shape[1])
+        q[matrix.indices[pick]] = matrix.data[pick]
+        qvecs.append(q / np.linalg.norm(q))
+    return qvecs
+
+def _timed(fn, qvecs):
+    start = time.perf_counter()
+    for q in qvecs:
+        fn(q)
+    return (time.perf_counter() - start) / max(1, len(qvecs))
+
+# Measures recall over bits x probes x tables, then times the smallest table
+# count meeting the target for each (bits, probes) against scoring every
+# row, and returns the fastest as a fitted LSHIndex, or None when exact
+# scoring wins. Table t of a fit uses the same planes whatever the table
+# count, so one max_tables fit per bits value covers every prefix.
+def calibrate(matrix, recall=0.95, qvecs=None, bits=(8, 12, 16), probes=(0, 1), max_tables=32, seed=0):
+    if qvecs is None:
+        qvecs = sample_queries(matrix, seed=seed)
+    best_rows = []
+    for q in qvecs:
+        scores = matrix @ q
+        best_rows.append(np.flatnonzero(scores == scores.max()))
+
+    options = []
+    for b in bits:
+        full = LSHIndex(max_tables, b, 0, seed).fit(matrix)
+        for p in probes:
+            full.probes = p
+            hits = np.zeros(max_tables)
+            for q, best in zip(qvecs, best_rows):
+                found = np.zeros(matrix.shape[0], dtype=bool)
+                for t, keys in enumerate(full.probe_keys(q)):
+                    found[full.rows(keys)] = True
+                    if found[best].any():
+                        hits[t:] += 1
+                        break
+            ok = np.flatnonzero(hits / max(1, len(qvecs)) >= recall)
+            if len(ok):
+                options.append(LSHIndex(int(ok[0]) + 1, b, p, seed).fit(matrix))
+
+    exact = _timed(lambda q: matrix @ q, qvecs)
+    choice = None
+    for lsh in options:
+        lsh.seconds = _timed(lambda q: matrix[lsh.candidates(q)] @ q, qvecs)
+        if lsh.seconds < exact and (choice is None or lsh.seconds < choice.seconds):
+            choice = lsh
+    if choice is not None:
+        choice.expected_recall = choice.recall(matrix, qvecs)
+    return choice
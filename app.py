@@ -1,11 +1,32 @@
 from flask import Flask, render_template, request, jsonify, session
 import time
-import random
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import main
+from sessions import SessionStore
 
 app = Flask(__name__)
 app.secret_key = "supersecretkey"
 
-DISEASES = ["cold", "flu", "migraine", "allergy", "covid-19", "sinusitis"]
+# diagnoses run on a small pool; /update-python hands back a job id and
+# /output/<job_id> answers as soon as that job is done
+RESULT_TTL = 5 * 60
+POLL_TIMEOUT = 25
+
+executor = ThreadPoolExecutor(max_workers=4)
+
+# symptom history per session, kept on the server (see sessions.py)
+health_records = SessionStore()
+jobs = {}
+jobs_lock = threading.Lock()
+
+def _expire_jobs():
+    cutoff = time.monotonic() - RESULT_TTL
+    with jobs_lock:
+        for job_id in [j for j, (_, created) in jobs.items() if created < cutoff]:
+            del jobs[job_id]
 
 @app.route("/")
 def home():
@@ -15,20 +36,44 @@ def home():
 def update_python():
     data = request.get_json()
     symptoms = data.get("input", "").lower()
-    
-    diagnosis = random.choice(DISEASES)
-
-    if "healthRecords" not in session:
-        session["healthRecords"] = []
-    session["healthRecords"].append(symptoms)
-    
-    return jsonify({"message": "Data received", "diagnosis": diagnosis})
-
-@app.route("/output")
-def output():
-    time.sleep(7)  
-    diagnosis = random.choice(DISEASES)
-    return diagnosis
+    # with k, /output answers JSON with the k best matches
+    k = data.get("k")
+    if k is not None and (not isinstance(k, int) or isinstance(k, bool) or k < 1):
+        return "k must be a positive integer", 400
+
+    _expire_jobs()
+    job_id = str(uuid.uuid4())
+    with jobs_lock:
+        if k is None:
+            jobs[job_id] = (executor.submit(main.diagnose, symptoms), time.monotonic())
+        else:
+            jobs[job_id] = (executor.submit(main.ranked_result, symptoms, k), time.monotonic())
+
+    if "sid" not in session:
+        session["sid"] = str(uuid.uuid4())
+    health_records.append(session["sid"], symptoms)
+
+    return jsonify({"message": "Data received", "id": job_id})
+
+# waits up to POLL_TIMEOUT for the result, then 202 so the client polls again
+@app.route("/output/<job_id>")
+def output(job_id):
+    with jobs_lock:
+        job = jobs.get(job_id)
+    if job is None:
+        return "unknown request id", 404
+    try:
+        result = job[0].result(timeout=POLL_TIMEOUT)
+    except TimeoutError:
+        return "pending", 202
+    except Exception as e:
+        return f"Error: {e}", 500
+    # no condition matched the input
+    if result is None:
+        return "", 204
+    if isinstance(result, dict):
+        return jsonify(result)
+    return result
 
 if __name__ == "__main__":
     app.run(debug=True)
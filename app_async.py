@@ -0,0 +1,70 @@
+from quart import Quart, render_template, request, jsonify, session
+import asyncio
+import uuid
+
+import main
+from sessions import SessionStore
+
+# Async variant of app.py (Quart, same routes). Waiting in /output is an
+# await, not a blocked thread, so one process can hold thousands of pending
+# requests. Run with: hypercorn app_async:app
+
+app = Quart(__name__)
+app.secret_key = "supersecretkey"
+
+RESULT_TTL = 5 * 60
+POLL_TIMEOUT = 25
+
+jobs = {}
+
+# symptom history per session, kept on the server (see sessions.py)
+health_records = SessionStore()
+
+@app.route("/")
+async def home():
+    return await render_template("index.html")
+
+@app.route("/update-python", methods=["POST"])
+async def update_python():
+    data = await request.get_json()
+    symptoms = data.get("input", "").lower()
+    # with k, /output answers JSON with the k best matches
+    k = data.get("k")
+    if k is not None and (not isinstance(k, int) or isinstance(k, bool) or k < 1):
+        return "k must be a positive integer", 400
+
+    loop = asyncio.get_running_loop()
+    job_id = str(uuid.uuid4())
+    if k is None:
+        jobs[job_id] = loop.run_in_executor(None, main.diagnose, symptoms)
+    else:
+        jobs[job_id] = loop.run_in_executor(None, main.ranked_result, symptoms, k)
+    loop.call_later(RESULT_TTL, jobs.pop, job_id, None)
+
+    if "sid" not in session:
+        session["sid"] = str(uuid.uuid4())
+    health_records.append(session["sid"], symptoms)
+
+    return jsonify({"message": "Data received", "id": job_id})
+
+# waits up to POLL_TIMEOUT for the result, then 202 so the client polls again
+@app.route("/output/<job_id>")
+async def output(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return "unknown request id", 404
+    try:
+        result = await asyncio.wait_for(asyncio.shield(job), POLL_TIMEOUT)
+    except asyncio.TimeoutError:
+        return "pending", 202
+    except Exception as e:
+        return f"Error: {e}", 500
+    # no condition matched the input
+    if result is None:
+        return "", 204
+    if isinstance(result, dict):
+        return jsonify(result)
+    return result
+
+if __name__ == "__main__":
+    app.run(debug=True)
@@ -0,0 +1,97 @@
+import os
+import json
+import mmap
+import struct
+import threading
+
+import numpy as np
+
+# Single-file model artifact: vocabulary, IDF weights, CSR symptom matrix
+# (with the raw term counts behind it, for incremental edits) and labels. The
+# arrays are stored raw and 8-byte aligned so load() can map them straight
+# out of the file; processes loading the same artifact share pages.
+#
+#   magic (8 bytes) | format version (u32) | header length (u32) | header JSON
+#   | padding | arrays...
+
+MAGIC = b"DXMODEL\0"
+FORMAT_VERSION = 3
+PREFIX = struct.Struct("<8sII")
+ALIGN = 8
+
+class ArtifactError(Exception):
+    pass
+
+def _pad(n):
+    return -n % ALIGN
+
+def save(path, model, corpus_hash):
+    index = model.index
+    matrix = index.matrix
+    # one index dtype for both, or scipy copies on load to make them agree
+    itype = "<i4" if max(matrix.nnz, matrix.shape[1]) < 2 ** 31 else "<i8"
+    arrays = {
+        "idf": np.ascontiguousarray(index.idf, dtype="<f8"),
+        "data": np.ascontiguousarray(matrix.data, dtype="<f8"),
+        "indices": np.ascontiguousarray(matrix.indices, dtype=itype),
+        "indptr": np.ascontiguousarray(matrix.indptr, dtype=itype),
+        "counts": np.ascontiguousarray(index.base_counts.data, dtype="<i4"),
+    }
+    vocabulary = index.terms
+
+    # offsets are relative to the first array, which follows the header
+    layout = {}
+    offset = 0
+    for name, arr in arrays.items():
+        layout[name] = [offset, arr.dtype.str, int(arr.size)]
+        offset += arr.nbytes + _pad(arr.nbytes)
+    header = {
+        "version": FORMAT_VERSION,
+        "hash": corpus_hash,
+        "shape": list(matrix.shape),
+        "labels": index.labels,
+        "vocabulary": vocabulary,
+        "arrays": layout,
+    }
+    raw = json.dumps(header).encode("utf-8")
+    start = PREFIX.size + len(raw) + _pad(PREFIX.size + len(raw))
+
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(PREFIX.pack(MAGIC, FORMAT_VERSION, len(raw)))
+        f.write(raw)
+        for name, arr in arrays.items():
+            f.write(b"\0" * (start + layout[name][0] - f.tell()))
+            f.write(arr.tobytes())
+    os.replace(tmp, path)
+
+# returns (labels, vocabulary, idf, matrix, counts) for ConditionIndex
+def load(path, corpus_hash=None):
+    from scipy import sparse
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < PREFIX.size:
+            raise ArtifactError(f"{path}: truncated")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, size = PREFIX.unpack_from(mm)
+    if magic != MAGIC:
+        raise ArtifactError(f"{path}: not a model artifact")
+    if version != FORMAT_VERSION:
+        raise ArtifactError(f"{path}: format version {version}, expected {FORMAT_VERSION}")
+    header = json.loads(mm[PREFIX.size:PREFIX.size + size].decode("utf-8"))
+    if corpus_hash is not None and header["hash"] != corpus_hash:
+        raise ArtifactError(f"{path}: built from a different condition list")
+
+    start = PREFIX.size + size + _pad(PREFIX.size + size)
+    arrays = {}
+    for name, (offset, dtype, count) in header["arrays"].items():
+        offset += start
+        if offset + np.dtype(dtype).itemsize * count > len(mm):
+            raise ArtifactError(f"{path}: truncated")
+        arrays[name] = np.frombuffer(mm, dtype=dtype, count=count, offset=offset)
+
+    shape = tuple(header["shape"])
+    matrix = sparse.csr_matrix((arrays["data"], arrays["indices"], arrays["indptr"]), shape=shape, copy=False)
+    counts = sparse.csr_matrix((arrays["counts"], arrays["indices"], arrays["indptr"]), shape=shape, copy=False)
+    vocabulary = {term: j for j, term in enumerate(header["vocabulary"])}
+    return header["labels"], vocabulary, arrays["idf"], matrix, counts
@@ -0,0 +1,406 @@
+import sys
+import json
+import time
+import logging
+import random
+
+import main
+import inverted
+
+# Benchmarks for the diagnosis path: python3 bench.py [name ...]
+
+QUERIES = [
+    "dry cough and high fever",
+    "headache",
+    "memory loss and confusion",
+    "chest pain shortness of breath",
+    "itchy eyes sneezing",
+    "joint pain and swelling",
+    "vomiting and diarrhea",
+    "blurry vision, thirst, frequent urination",
+    "feeling sad and tired all the time",
+    "numbness and tingling in my hands",
+]
+
+def synthetic_corpus(n, seed=0, rare=0):
+    # n fake conditions, each a random mix of the real symptom phrases, plus
+    # `rare` made-up terms from a pool that grows with n (a long-tail vocabulary)
+    rng = random.Random(seed)
+    phrases = [p.strip() for s in main.symp for p in s.split(",")]
+    titles = [f"condition {i}" for i in range(n)]
+    descps = [", ".join(rng.sample(phrases, rng.randint(3, 7)) + [f"sign{rng.randrange(n)}" for _ in range(rare)])
+              for _ in range(n)]
+    return titles, descps
+
+def timeit(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+def report(name, seconds):
+    print(f"  {name:<32} {seconds * 1e6:>10.1f} us")
+
+def bench_scorer():
+    from sklearn.neighbors import KNeighborsClassifier
+
+    for n in (len(main.symp), 1000, 10000, 50000):
+        if n == len(main.symp):
+            titles, descps = main.cond, main.symp
+        else:
+            titles, descps = synthetic_corpus(n)
+        model = main.DiagnosisModel.build(titles, descps)
+        main_m = KNeighborsClassifier(n_neighbors=1)
+        main_m.fit(model.index.matrix, titles)
+
+        qvecs = [model.vectorize([q]) for q in QUERIES]
+        batch = model.vectorize(QUERIES * 100)
+        repeat = max(3, 2000 // max(1, n // 100))
+
+        print(f"{n} conditions")
+        report("knn predict (1 query)", timeit(lambda: [main_m.predict(q) for q in qvecs], repeat) / len(qvecs))
+        report("scorer predict (1 query)", timeit(lambda: [model.index.predict(q) for q in qvecs], repeat) / len(qvecs))
+        report("knn predict (batch, per query)", timeit(lambda: main_m.predict(batch), 3) / batch.shape[0])
+        report("scorer batch (per query)", timeit(lambda: model.index.predict_batch(batch), 3) / batch.shape[0])
+
+def bench_ann():
+    import ann
+
+    for n in (10000, 50000, 200000):
+        titles, descps = synthetic_corpus(n)
+        matrix = main.DiagnosisModel.build(titles, descps).index.matrix
+        qvecs = ann.sample_queries(matrix, seed=1)
+
+        print(f"{n} conditions")
+        report("exact (1 query)", timeit(lambda: [matrix @ q for q in qvecs], 3) / len(qvecs))
+        print(f"  {'bits':>4} {'probes':>6} {'tables':>6} {'recall':>7} {'candidates':>10} {'latency':>13}")
+        for bits in (12, 16):
+            for probes in (0, 1):
+                for tables in (4, 8, 16, 32):
+                    lsh = ann.LSHIndex(tables, bits, probes).fit(matrix)
+                    seconds = timeit(lambda: [matrix[lsh.candidates(q)] @ q for q in qvecs], 3) / len(qvecs)
+                    size = sum(len(lsh.candidates(q)) for q in qvecs) // len(qvecs)
+                    print(f"  {bits:>4} {probes:>6} {tables:>6} {lsh.recall(matrix, qvecs):>7.3f} {size:>10} {seconds * 1e6:>10.1f} us")
+
+def bench_inverted():
+    import ann
+
+    for n in (10000, 50000, 200000):
+        titles, descps = synthetic_corpus(n, rare=3)
+        model = main.DiagnosisModel.build(titles, descps)
+        index = model.index
+        for name, qvecs in (("symptom queries", [model.vector(q) for q in QUERIES]),
+                            ("partial rows", ann.sample_queries(index.matrix, seed=1))):
+            print(f"{n} conditions, {name}")
+            index.set_prefilter(None)
+            report("exact (1 query)", timeit(lambda: [index.predict(q) for q in qvecs], 3) / len(qvecs))
+            index.set_prefilter(inverted.InvertedIndex())
+            report("inverted index (1 query)", timeit(lambda: [index.predict(q) for q in qvecs], 3) / len(qvecs))
+            share = sum(len(index.prefilter.candidates(q)) for q in qvecs) / len(qvecs) / len(index)
+            print(f"  {'rows scored':<32} {share:>12.1%}")
+
+def bench_cache():
+    titles, descps = synthetic_corpus(50000)
+    model = main.DiagnosisModel.build(titles, descps)
+    model.cache.maxsize = 0
+    report("uncached predict (1 query)", timeit(lambda: [model.predict(q) for q in QUERIES], 20) / len(QUERIES))
+    model.cache = main.QueryCache(main.QUERY_CACHE_SIZE, main.QUERY_CACHE_TTL)
+    report("cached predict (1 query)", timeit(lambda: [model.predict(q) for q in QUERIES], 20) / len(QUERIES))
+    print(f"  {'hit ratio':<32} {model.cache.stats()['hit_ratio']:>12.1%}")
+
+def _serve_flask(port):
+    from werkzeug.serving import make_server
+    import app
+
+    main.default_model()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    make_server("127.0.0.1", port, app.app, threaded=True).serve_forever()
+
+# a fixed pool of request threads, as waitress or gunicorn (gthread) run it
+def _serve_flask_pool(port, threads=8):
+    import socketserver
+    from concurrent.futures import ThreadPoolExecutor
+    from werkzeug.serving import BaseWSGIServer
+    import app
+
+    class PooledServer(socketserver.ThreadingMixIn, BaseWSGIServer):
+        pool = ThreadPoolExecutor(threads)
+
+        def process_request(self, request, client_address):
+            self.pool.submit(self.process_request_thread, request, client_address)
+
+    main.default_model()
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    PooledServer("127.0.0.1", port, app.app).serve_forever()
+
+def _serve_quart(port):
+    import asyncio
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+    import app_async
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.accesslog = None
+    main.default_model()
+    asyncio.run(serve(app_async.app, config))
+
+# server RSS (MB) and thread count, from /proc
+def _proc_usage(pid):
+    usage = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "Threads"):
+                usage[key] = int(value.split()[0])
+    return usage.get("VmRSS", 0) / 1024, usage.get("Threads", 0)
+
+async def _request(port, method, path, body, timeout):
+    import asyncio
+
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+    if body is not None:
+        head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+    reader, writer = await asyncio.wait_for(asyncio.open_connection("127.0.0.1", port), timeout)
+    writer.write((head + "\r\n").encode() + (body or b""))
+    raw = await asyncio.wait_for(reader.read(), timeout)
+    writer.close()
+    status, _, rest = raw.partition(b"\r\n")
+    return status.split()[1] == b"200", rest.partition(b"\r\n\r\n")[2]
+
+# one submit + fetch round trip, as the page does it
+async def _diagnose(port, text, timeout):
+    import asyncio
+
+    try:
+        ok, body = await _request(port, "POST", "/update-python", json.dumps({"input": text}).encode(), timeout)
+        if not ok:
+            return False
+        ok, _ = await _request(port, "GET", f"/output/{json.loads(body)['id']}", None, timeout)
+        return ok
+    except (OSError, ValueError, IndexError, asyncio.TimeoutError):
+        return False
+
+# n concurrent diagnoses, all started at once; the server is sampled
+# while they run
+async def _load(port, pid, n, timeout):
+    import asyncio
+
+    peak = [0.0, 0]
+    async def sample():
+        while True:
+            rss, threads = _proc_usage(pid)
+            peak[0], peak[1] = max(peak[0], rss), max(peak[1], threads)
+            await asyncio.sleep(0.5)
+
+    sampler = asyncio.ensure_future(sample())
+    start = time.perf_counter()
+    ok = await asyncio.gather(*(_diagnose(port, QUERIES[i % len(QUERIES)], timeout) for i in range(n)))
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+    return sum(ok), elapsed, peak[0], peak[1]
+
+def _wait_listening(port, timeout=60):
+    import socket
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), 1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+
+def bench_http():
+    import asyncio
+    import socket
+    import multiprocessing
+
+    servers = (
+        ("flask, 8 request threads", _serve_flask_pool),
+        ("flask, thread per request", _serve_flask),
+        ("quart (asyncio)", _serve_quart),
+    )
+    for name, serve in servers:
+        print(name)
+        for n in (100, 1000, 3000):
+            # a fresh server each time, so no backlog carries over
+            with socket.socket() as s:
+                s.bind(("127.0.0.1", 0))
+                port = s.getsockname()[1]
+            server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+            server.start()
+            _wait_listening(port)
+            ok, elapsed, rss, threads = asyncio.run(_load(port, server.pid, n, 60))
+            print(f"  {n:>5} concurrent: {ok:>5} ok in {elapsed:>5.1f} s, server peak {rss:>6.1f} MB, {threads:>5} threads")
+            server.terminate()
+            server.join()
+
+def _health_users(n, records, seed=0):
+    rng = random.Random(seed)
+    return {
+        f"user{i}": {"password": "pw", "data": {
+            "weight_records": [{"date": "2024-01-01", "weight": rng.uniform(50, 100)} for _ in range(records)],
+            "meal_records": [], "exercise_records": [], "water_records": [],
+            "daily_goals": {"steps": 10000, "water_ml": 2000},
+        }}
+        for i in range(n)
+    }
+
+# one weight entry recorded: app2's old load-everything/dump-everything save
+# against a journal append
+def bench_journal():
+    import os
+    import tempfile
+    import journal
+
+    entry = {"date": "2024-01-02", "weight": 70.0}
+    for n in (100, 1000, 10000):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "users.json")
+            with open(path, "w") as f:
+                json.dump(_health_users(n, 50), f, indent=4)
+
+            def rewrite():
+                with open(path) as f:
+                    users = json.load(f)
+                users["user0"]["data"]["weight_records"].append(entry)
+                with open(path, "w") as f:
+                    json.dump(users, f, indent=4)
+
+            store = journal.Journal(path, compact_bytes=1 << 40)
+            append = lambda: store.append({"user": "user0", "op": "append", "field": "weight_records", "value": entry})
+            print(f"{n} users, 50 records each ({os.path.getsize(path) >> 10} KB)")
+            report("rewrite users.json (1 record)", timeit(rewrite, 3))
+            report("journal append (1 record)", timeit(append, 200))
+            report("compaction", timeit(store.compact, 1))
+
+# app2's per-user operations on each storage backend
+def bench_storage():
+    import os
+    import tempfile
+    import storage
+
+    entry = {"date": "2024-01-02", "weight": 70.0}
+    for n in (100, 1000, 10000):
+        users = _health_users(n, 50)
+        with tempfile.TemporaryDirectory() as tmp:
+            backends = {
+                "json": storage.JsonStorage(os.path.join(tmp, "users.json")),
+                "sharded": storage.ShardedStorage(os.path.join(tmp, "users.d")),
+                "sqlite": storage.SQLiteStorage(os.path.join(tmp, "health.db")),
+            }
+            print(f"{n} users, 50 records each")
+            for name, store in backends.items():
+                store.save_all(users)
+                report(f"{name} login (1 user)", timeit(lambda: store.get_user("user0"), 20))
+                report(f"{name} record (1 entry)", timeit(lambda: store.append("user0", "weight_records", entry), 200))
+                report(f"{name} weekly report", timeit(lambda: store.records("user0", "weight_records", "2024-01-01", "2024-01-07"), 20))
+            backends["sqlite"].close()
+
+# one writer process: `records` entries for its own user, each followed by
+# one for the user every writer shares. Exits 1 if any thread (a background
+# compaction included) raised.
+def _writer(kind, path, worker, records, compact_bytes):
+    import threading
+
+    failed = []
+    hook = threading.excepthook
+
+    def record_failure(args):
+        failed.append(args)
+        hook(args)
+
+    threading.excepthook = record_failure
+    store = _open_store(kind, path, compact_bytes)
+    for i in range(records):
+        store.append(f"writer{worker}", "water_records", {"date": "2024-01-02", "amount_ml": i})
+        store.append("shared", "water_records", {"date": "2024-01-02", "amount_ml": worker})
+    store.close()
+    sys.exit(1 if failed else 0)
+
+def _open_store(kind, path, compact_bytes):
+    import storage
+
+    if kind == "sqlite":
+        return storage.SQLiteStorage(path)
+    if kind == "json":
+        return storage.JsonStorage(path, compact_bytes=compact_bytes)
+    return storage.ShardedStorage(path, compact_bytes=compact_bytes)
+
+# what is wrong with the stored records after a _writer run, if anything:
+# each writer's own entries must read back 0..records-1 in order, and the
+# shared user must hold exactly `records` entries from every writer
+def _check_writers(store, n, records):
+    problems = []
+    expected = [{"date": "2024-01-02", "amount_ml": i} for i in range(records)]
+    for i in range(n):
+        got = store.records(f"writer{i}", "water_records")
+        if got != expected:
+            problems.append(f"writer{i}: {len(got)} of {records} records, or not as written")
+    shared = {}
+    for entry in store.records("shared", "water_records"):
+        shared[entry["amount_ml"]] = shared.get(entry["amount_ml"], 0) + 1
+    if shared != {i: records for i in range(n)}:
+        problems.append(f"shared: {sum(shared.values())} of {n * records} records, or not as written")
+    return problems
+
+# N app2 processes recording at once; every record must survive, including
+# through the compactions a small compact_bytes forces. Exits non-zero if a
+# writer failed or a record is missing or wrong.
+def bench_writers(records=500, compact_bytes=16 << 10):
+    import os
+    import tempfile
+    import multiprocessing
+
+    failures = []
+    paths = {"json": "users.json", "sharded": "users.d", "sqlite": "health.db"}
+    for kind, name in paths.items():
+        print(kind)
+        for n in (1, 4, 16):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, name)
+                users = _health_users(n, 0)
+                users = {f"writer{i}": user for i, user in enumerate(users.values())}
+                users["shared"] = _health_users(1, 0)["user0"]
+                store = _open_store(kind, path, compact_bytes)
+                store.save_all(users)
+                store.close()
+
+                writers = [
+                    multiprocessing.Process(target=_writer, args=(kind, path, i, records, compact_bytes))
+                    for i in range(n)
+                ]
+                start = time.perf_counter()
+                for w in writers:
+                    w.start()
+                for w in writers:
+                    w.join()
+                seconds = time.perf_counter() - start
+
+                store = _open_store(kind, path, compact_bytes)
+                kept = sum(len(store.records(f"writer{i}", "water_records")) for i in range(n))
+                kept += len(store.records("shared", "water_records"))
+                problems = _check_writers(store, n, records)
+                store.close()
+                problems += [f"writer{i} exited with {w.exitcode}" for i, w in enumerate(writers) if w.exitcode != 0]
+                lost = 2 * n * records - kept
+                print(f"  {n:>3} writers: {2 * n * records / seconds:>8.0f} records/s, {lost} lost")
+                failures += [f"{kind}, {n} writers: {p}" for p in problems]
+    if failures:
+        sys.exit("\n".join(["bench writers failed:"] + failures))
+
+BENCHMARKS = {
+    "scorer": bench_scorer,
+    "ann": bench_ann,
+    "inverted": bench_inverted,
+    "cache": bench_cache,
+    "http": bench_http,
+    "journal": bench_journal,
+    "storage": bench_storage,
+    "writers": bench_writers,
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
@@ -0,0 +1,95 @@
+import sys
+import time
+import threading
+from collections import OrderedDict
+
+# Size-bounded LRU cache of query results with a TTL. Entries are tagged with
+# the index version they were computed against; a lookup with a newer
+# version drops everything, so edits to the condition list never serve a
+# stale answer. Safe to share between threads.
+
+class QueryCache:
+    def __init__(self, maxsize=4096, ttl=300.0, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.version = None
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    # approximate memory of one entry: key and value objects plus their items
+    @staticmethod
+    def _size(key, value):
+        size = sys.getsizeof(key) + sys.getsizeof(value)
+        for part in (key, value):
+            if isinstance(part, (tuple, list)):
+                size += sum(sys.getsizeof(item) for item in part)
+        return size
+
+    def _check(self, version):
+        if version != self.version:
+            if self.entries:
+                self.invalidations += 1
+            self._clear()
+            self.version = version
+
+    def clear(self):
+        with self.lock:
+            self._clear()
+
+    def _clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+    def get(self, key, version=None):
+        with self.lock:
+            self._check(version)
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] <= self.clock():
+                self._pop(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, version=None):
+        if self.maxsize <= 0:
+            return
+        size = self._size(key, value)
+        with self.lock:
+            self._check(version)
+            if key in self.entries:
+                self._pop(key)
+            self.entries[key] = (value, self.clock() + self.ttl, size)
+            self.nbytes += size
+            while len(self.entries) > self.maxsize:
+                self._pop(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _pop(self, key):
+        self.nbytes -= self.entries.pop(key)[2]
+
+    def stats(self):
+        with self.lock:
+            return self._stats()
+
+    def _stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
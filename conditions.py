@@ -0,0 +1,42 @@
+import csv
+import json
+
+# Streaming readers for an external condition list. Rows are yielded one at
+# a time as (condition, symptoms), so a large file is never held in memory.
+#
+#   .jsonl / .ndjson: {"condition": ..., "symptoms": ...} or [condition, symptoms]
+#   anything else is CSV: condition,symptoms (an optional header row is skipped;
+#   columns after the first are all symptoms, so the list need not be quoted)
+
+def read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for n, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+                if isinstance(row, dict):
+                    yield row["condition"], row["symptoms"]
+                else:
+                    yield row[0], row[1]
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                raise ValueError(f"{path}:{n}: bad condition row ({e})") from None
+
+def read_csv(path):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if not row:
+                continue
+            if reader.line_num == 1 and [c.strip().lower() for c in row[:2]] == ["condition", "symptoms"]:
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{reader.line_num}: expected condition,symptoms")
+            # unquoted symptom lists split on their own commas; put them back
+            yield row[0], ",".join(row[1:])
+
+def read_conditions(path):
+    if path.endswith((".jsonl", ".ndjson")):
+        return read_jsonl(path)
+    return read_csv(path)
@@ -0,0 +1,311 @@
+import math
+from array import array
+
+import numpy as np
+from scipy import sparse
+
+from scorer import CosineScorer
+
+# Editable symptom index. Each condition occupies a slot; adds, edits and
+# removals only touch that slot's term counts and the document frequencies.
+# The weighted CSR matrix and the IDF weights are recomputed in one batch
+# (refresh) once the changed rows add up to REFRESH_RATIO of the indexed
+# terms. Until then changed rows are scored from a small side matrix
+# weighted with the IDF as of the last refresh. After a refresh the index
+# matches a full TF-IDF rebuild of the same conditions.
+
+REFRESH_RATIO = 0.05
+BUILD_CHUNK = 2048
+
+# smoothed idf, as TfidfVectorizer computes it
+def idf_weight(n, df):
+    return math.log((1 + n) / (1 + df)) + 1
+
+# counts x idf, each row scaled to unit length
+def _normalize(counts, idf):
+    weights = counts.astype(np.float64)
+    weights.data *= idf[weights.indices]
+    norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    weights.data /= np.repeat(norms, np.diff(weights.indptr))
+    return weights
+
+def chunked(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# one chunk of (label, terms) rows -> labels, the chunk's own vocabulary (by
+# local column) and its term counts as CSR arrays; picklable for a process pool
+def count_rows(rows):
+    labels, vocabulary = [], {}
+    indptr, indices, data = array("q", [0]), array("i"), array("i")
+    for label, terms in rows:
+        labels.append(label)
+        counts = {}
+        for term in terms:
+            col = vocabulary.setdefault(term, len(vocabulary))
+            counts[col] = counts.get(col, 0) + 1
+        indices.extend(counts)
+        data.extend(counts.values())
+        indptr.append(len(indices))
+    return labels, list(vocabulary), indptr, indices, data
+
+class ConditionIndex(CosineScorer):
+    def __init__(self, labels=(), vocabulary=None, idf=None, weights=None, counts=None):
+        self.labels = list(labels)
+        self.slot_of = {label: slot for slot, label in enumerate(self.labels)}
+        self.vocabulary = dict(vocabulary or {})
+        self.terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        n_cols = len(self.terms)
+        if counts is None:
+            counts = sparse.csr_matrix((len(self.labels), n_cols), dtype=np.float64)
+        if weights is None:
+            weights = counts
+        self.idf = np.zeros(n_cols) if idf is None else np.asarray(idf, dtype=np.float64)
+        self.df = np.bincount(counts.indices, minlength=n_cols).tolist()
+        self.base_weights = weights
+        self.base_counts = counts
+        self.n_base = len(self.labels)
+        self.pending = {}
+        self.removed = set()
+        self.dirty = 0
+        self.version = 0
+        self.prefilter = None
+        self._tail = None
+
+    # bulk load: joins count_rows() chunks, in order, and a repeated label
+    # replaces the earlier row. Local columns are renumbered in first-seen
+    # order, so the result does not depend on how rows were split.
+    @classmethod
+    def merge(cls, chunks):
+        labels, vocabulary = [], {}
+        indptrs, indices, data = [np.zeros(1, dtype=np.int64)], [], []
+        nnz = 0
+        for c_labels, c_terms, c_indptr, c_indices, c_data in chunks:
+            remap = np.array([vocabulary.setdefault(t, len(vocabulary)) for t in c_terms], dtype=np.int32)
+            c_indptr = np.frombuffer(c_indptr, dtype=np.int64)
+            indices.append(remap[np.frombuffer(c_indices, dtype=np.int32)])
+            data.append(np.frombuffer(c_data, dtype=np.int32))
+            indptrs.append(c_indptr[1:] + nnz)
+            nnz += int(c_indptr[-1])
+            labels.extend(c_labels)
+        counts = sparse.csr_matrix(
+            (np.concatenate(data or [np.zeros(0, np.int32)]),
+             np.concatenate(indices or [np.zeros(0, np.int32)]),
+             np.concatenate(indptrs)),
+            shape=(len(labels), len(vocabulary)),
+        )
+        index = cls(labels, vocabulary, counts=counts)
+        for slot, label in enumerate(labels):
+            if index.slot_of[label] != slot:
+                index.labels[slot] = None
+                index.removed.add(slot)
+        index.refresh()
+        return index
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.slot_of
+
+    def live(self):
+        return len(self.slot_of)
+
+    def row_counts(self, slot):
+        if slot in self.pending:
+            return self.pending[slot]
+        if slot >= self.n_base or slot in self.removed:
+            return {}
+        a, b = self.base_counts.indptr[slot], self.base_counts.indptr[slot + 1]
+        return dict(zip(self.base_counts.indices[a:b].tolist(), self.base_counts.data[a:b].tolist()))
+
+    def add(self, label, terms):
+        if label in self.slot_of:
+            self.update(label, terms)
+            return
+        slot = len(self.labels)
+        self.labels.append(label)
+        self.slot_of[label] = slot
+        self._set(slot, terms)
+
+    def update(self, label, terms):
+        slot = self.slot_of[label]
+        self._drop(slot)
+        self._set(slot, terms)
+
+    def remove(self, label):
+        slot = self.slot_of.pop(label)
+        changed = self._drop(slot)
+        self.labels[slot] = None
+        self.pending.pop(slot, None)
+        self.removed.add(slot)
+        self._changed(changed)
+
+    def _drop(self, slot):
+        old = self.row_counts(slot)
+        for col in old:
+            self.df[col] -= 1
+        return len(old)
+
+    def _set(self, slot, terms):
+        counts = {}
+        for term in terms:
+            col = self.vocabulary.get(term)
+            if col is None:
+                col = self.vocabulary[term] = len(self.terms)
+                self.terms.append(term)
+                self.df.append(0)
+            counts[col] = counts.get(col, 0) + 1
+        for col in counts:
+            self.df[col] += 1
+        self.pending[slot] = counts
+        self.removed.discard(slot)
+        if len(self.idf) < len(self.terms):
+            n = self.live()
+            extra = [idf_weight(n, self.df[col]) for col in range(len(self.idf), len(self.terms))]
+            self.idf = np.concatenate([self.idf, extra])
+        self._changed(len(counts))
+
+    def _changed(self, nnz):
+        self.version += 1
+        self.dirty += max(1, nnz)
+        self._tail = None
+        if self.dirty > REFRESH_RATIO * self.base_counts.nnz:
+            self.refresh()
+
+    def _tail_rows(self):
+        if self._tail is None:
+            slots = sorted(self.pending)
+            indptr, indices, data = [0], [], []
+            for slot in slots:
+                row = sorted(self.pending[slot].items())
+                indices.extend(col for col, _ in row)
+                data.extend(count for _, count in row)
+                indptr.append(len(indices))
+            counts = sparse.csr_matrix((data, indices, indptr), shape=(len(slots), len(self.terms)))
+            self._tail = (np.array(slots, dtype=np.intp), _normalize(counts, self.idf))
+        return self._tail
+
+    # recompute document frequencies, IDF and the weighted matrix, dropping
+    # removed slots and terms no condition uses any more
+    def refresh(self):
+        n_cols = len(self.terms)
+        base = self.base_counts
+        if base.shape[1] < n_cols:
+            base = sparse.csr_matrix((base.data, base.indices, base.indptr), shape=(base.shape[0], n_cols))
+        slots = sorted(self.pending)
+        tail = sparse.csr_matrix((len(slots), n_cols), dtype=np.float64)
+        if slots:
+            rows = [sorted(self.pending[slot].items()) for slot in slots]
+            tail = sparse.csr_matrix((
+                [count for row in rows for _, count in row],
+                [col for row in rows for col, _ in row],
+                np.cumsum([0] + [len(row) for row in rows]),
+            ), shape=(len(slots), n_cols))
+        tail_pos = {slot: self.n_base + i for i, slot in enumerate(slots)}
+        live = [slot for slot, label in enumerate(self.labels) if label is not None]
+        order = [tail_pos.get(slot, slot) for slot in live]
+        counts = sparse.vstack([base, tail], format="csr")[order]
+
+        df = np.bincount(counts.indices, minlength=n_cols)
+        keep = [col for col in sorted(range(n_cols), key=self.terms.__getitem__) if df[col] > 0]
+        remap = np.zeros(n_cols, dtype=counts.indices.dtype)
+        remap[keep] = np.arange(len(keep))
+        counts = sparse.csr_matrix((counts.data, remap[counts.indices], counts.indptr), shape=(len(live), len(keep)))
+        counts.sort_indices()
+
+        n = len(live)
+        idf = np.log((1 + n) / (1 + df[keep].astype(np.float64))) + 1
+
+        self.labels = [self.labels[slot] for slot in live]
+        self.slot_of = {label: slot for slot, label in enumerate(self.labels)}
+        self.terms = [self.terms[col] for col in keep]
+        self.vocabulary = {term: col for col, term in enumerate(self.terms)}
+        self.df = df[keep].tolist()
+        self.idf = idf
+        self.base_counts = counts
+        self.base_weights = _normalize(counts, idf)
+        self.n_base = n
+        self.pending = {}
+        self.removed = set()
+        self.dirty = 0
+        self._tail = None
+        if self.prefilter is not None:
+            self.prefilter.fit(self.base_weights)
+
+    # candidate stage in front of scoring (inverted.InvertedIndex,
+    # ann.LSHIndex): anything with fit(matrix) and candidates(qvec) -> sorted
+    # row numbers, optionally scored(qvec) -> (rows, scores) when it can score
+    # them itself; None scores every row
+    def set_prefilter(self, prefilter):
+        if self.pending or self.removed:
+            self.refresh()
+        self.prefilter = prefilter
+        if prefilter is not None:
+            prefilter.fit(self.base_weights)
+
+    @property
+    def matrix(self):
+        if self.pending or self.removed:
+            self.refresh()
+        return self.base_weights
+
+    def scores(self, qvec):
+        if hasattr(qvec, "toarray"):
+            qvec = qvec.toarray().ravel()
+        out = np.full(len(self.labels), -1.0)
+        out[:self.n_base] = self.base_weights @ qvec[:self.base_weights.shape[1]]
+        if self.removed:
+            out[list(self.removed)] = -1.0
+        if self.pending:
+            slots, tail = self._tail_rows()
+            out[slots] = tail @ qvec[:tail.shape[1]]
+        return out
+
+    def scored(self, qvec):
+        if self.prefilter is None:
+            return super().scored(qvec)
+        if hasattr(qvec, "toarray"):
+            qvec = qvec.toarray().ravel()
+        if hasattr(self.prefilter, "scored"):
+            rows, scores = self.prefilter.scored(qvec)
+        else:
+            rows = self.prefilter.candidates(qvec)
+            scores = self.base_weights[rows] @ qvec[:self.base_weights.shape[1]]
+        if self.pending or self.removed:
+            keep = ~np.isin(rows, list(self.removed) + list(self.pending))
+            rows, scores = rows[keep], scores[keep]
+        if self.pending:
+            slots, tail = self._tail_rows()
+            # edited rows are always scored; only the ones that match count
+            extra = tail @ qvec[:tail.shape[1]]
+            rows = np.concatenate([rows, slots[extra > 0]])
+            scores = np.concatenate([scores, extra[extra > 0]])
+            order = np.argsort(rows, kind="stable")
+            rows, scores = rows[order], scores[order]
+        if not len(rows):
+            return super().scored(qvec)
+        return rows, scores
+
+    def predict_batch(self, qvecs):
+        if self.prefilter is None:
+            return super().predict_batch(qvecs)
+        qvecs = qvecs.tocsr()
+        return [self.predict(qvecs[i]) for i in range(qvecs.shape[0])]
+
+    def block_scores(self, qvecs):
+        out = np.full((qvecs.shape[0], len(self.labels)), -1.0)
+        out[:, :self.n_base] = (qvecs[:, :self.base_weights.shape[1]] @ self.base_weights.T).toarray()
+        if self.removed:
+            out[:, list(self.removed)] = -1.0
+        if self.pending:
+            slots, tail = self._tail_rows()
+            out[:, slots] = (qvecs[:, :tail.shape[1]] @ tail.T).toarray()
+        return out
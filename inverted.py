@@ -0,0 +1,37 @@
+import numpy as np
+
+# Exact candidate pruning: postings from each term column to the rows that
+# use it, with their weights. A row sharing no term with the query scores 0,
+# and a matching row's cosine is the sum over the shared terms, so the
+# query's postings alone give every nonzero score.
+
+class InvertedIndex:
+    def fit(self, matrix):
+        matrix = matrix.tocsr()
+        rows = np.repeat(np.arange(matrix.shape[0], dtype=matrix.indices.dtype), np.diff(matrix.indptr))
+        order = np.argsort(matrix.indices, kind="stable")
+        self.rows = rows[order]
+        self.weights = matrix.data[order]
+        self.indptr = np.concatenate([[0], np.cumsum(np.bincount(matrix.indices, minlength=matrix.shape[1]))])
+        self.n_rows = matrix.shape[0]
+        return self
+
+    # positions in rows/weights of the query terms' postings, and the
+    # matching query weight for each
+    def _gather(self, qvec):
+        cols = np.flatnonzero(qvec[:len(self.indptr) - 1])
+        starts, ends = self.indptr[cols], self.indptr[cols + 1]
+        lens = ends - starts
+        pos = np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(lens.sum())
+        return pos, np.repeat(qvec[cols], lens)
+
+    def candidates(self, qvec):
+        pos, _ = self._gather(qvec)
+        return np.flatnonzero(np.bincount(self.rows[pos], minlength=self.n_rows))
+
+    # (rows, scores) for every row sharing a term with the query
+    def scored(self, qvec):
+        pos, qweights = self._gather(qvec)
+        scores = np.bincount(self.rows[pos], weights=self.weights[pos] * qweights, minlength=self.n_rows)
+        rows = np.flatnonzero(scores)
+        return rows, scores[rows]
@@ -0,0 +1,299 @@
+import os
+import json
+import time
+import threading
+import contextlib
+
+try:
+    import fcntl
+except ImportError:
+    # no flock (Windows): threads of one process still exclude each other,
+    # separate processes do not
+    fcntl = None
+
+# users.json as a snapshot plus an append-only journal. Recording an entry
+# appends one JSON line to the journal instead of rewriting every user;
+# load() replays the journal over the snapshot. Once the journal passes
+# compact_bytes, a background thread folds it into a new snapshot.
+#
+# Journal lines:
+#   {"seq": n, "user": name, "op": "put", "password": ..., "data": {...}}
+#   {"seq": n, "user": name, "op": "append", "field": ..., "value": ...}
+#   {"seq": n, "user": name, "op": "set", "field": ..., "value": ...}
+#
+# Each user in the snapshot remembers the last seq applied to it, so if a
+# compaction dies after writing the snapshot but before removing the
+# journal it merged, replaying that journal again changes nothing.
+#
+# Beside the snapshot, users.json.idx lists where each user's entry starts
+# and how long it is, sorted by name in fixed-width lines, so load_user()
+# finds one account with a binary search and a single read. The journal is
+# still scanned, but it is capped at compact_bytes whatever the user count.
+#
+# Several processes may share the files. users.json.lock is flocked shared
+# by readers and exclusive by appends and file swaps, and also holds the
+# last seq handed out, so seqs grow in journal order across processes.
+# users.json.compact.lock lets one process at a time compact or save.
+
+COMPACT_BYTES = 1 << 20
+
+def apply(users, entry):
+    name = entry["user"]
+    user = users.get(name)
+    if user is not None and entry["seq"] <= user.get("seq", 0):
+        return
+    if entry["op"] == "put":
+        user = users[name] = {"password": entry["password"], "data": entry["data"]}
+    elif user is None:
+        return
+    elif entry["op"] == "append":
+        user["data"].setdefault(entry["field"], []).append(entry["value"])
+    elif entry["op"] == "set":
+        user["data"][entry["field"]] = entry["value"]
+    user["seq"] = entry["seq"]
+
+# with a name, only that user's entries are applied
+def replay(users, path, name=None):
+    if not os.path.exists(path):
+        return users
+    needle = None if name is None else f'"user": {json.dumps(name)}'
+    with open(path, "r") as f:
+        for line in f:
+            if needle is not None and needle not in line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # a torn last line from a crash mid-append
+                continue
+            if name is None or entry["user"] == name:
+                apply(users, entry)
+    return users
+
+def index_path(path):
+    return path + ".idx"
+
+# Written beside the snapshot, with its index; install_snapshot() moves
+# both into place. The bytes match json.dump(users, f, indent=4).
+def write_snapshot(path, users):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    entries = []
+    with open(tmp, "wb") as f:
+        f.write(b"{")
+        for i, (name, user) in enumerate(users.items()):
+            f.write(b",\n    " if i else b"\n    ")
+            key = json.dumps(name)
+            text = f"{key}: " + json.dumps(user, indent=4).replace("\n", "\n    ")
+            entries.append((key, f.tell(), len(text)))
+            f.write(text.encode())
+        f.write(b"\n}" if users else b"}")
+        f.flush()
+        os.fsync(f.fileno())
+        size = f.tell()
+    lines = sorted(f"{key}\t{offset}\t{length}" for key, offset, length in entries)
+    width = max(map(len, lines), default=0) + 1
+    with open(index_path(tmp), "w") as f:
+        f.write(f"{width} {size}\n")
+        f.writelines(f"{line:<{width - 1}}\n" for line in lines)
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp
+
+# Index first: until the snapshot follows, lookups land on entries that do
+# not match and read_user() falls back to the whole file.
+def install_snapshot(tmp, path):
+    os.replace(index_path(tmp), index_path(path))
+    os.replace(tmp, path)
+
+def read_snapshot(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+# whether the snapshot has an index written for it (same size)
+def index_current(path):
+    try:
+        with open(index_path(path), "rb") as f:
+            return int(f.readline().split()[1]) == os.path.getsize(path)
+    except (OSError, ValueError, IndexError):
+        return False
+
+# (offset, length) of a JSON-encoded name in an index, or None; raises
+# ValueError when the index was written for a snapshot of another size
+def lookup(path, key, size):
+    with open(path, "rb") as f:
+        width, indexed = map(int, f.readline().split())
+        if indexed != size:
+            raise ValueError(path)
+        base = f.tell()
+        lo, hi = 0, (os.fstat(f.fileno()).st_size - base) // width
+        while lo < hi:
+            mid = (lo + hi) // 2
+            f.seek(base + mid * width)
+            name, offset, length = f.read(width).decode().rstrip().split("\t")
+            if name == key:
+                return int(offset), int(length)
+            if name < key:
+                lo = mid + 1
+            else:
+                hi = mid
+    return None
+
+# one user from the snapshot, through its index when there is one
+def read_user(path, name):
+    if not os.path.exists(path):
+        return None
+    key = json.dumps(name)
+    try:
+        found = lookup(index_path(path), key, os.path.getsize(path))
+    except (OSError, ValueError):
+        return read_snapshot(path).get(name)
+    if found is None:
+        return None
+    offset, length = found
+    # the entry must start a top-level line with this user's key
+    head = f"\n    {key}: "
+    with open(path, "rb") as f:
+        f.seek(offset - 5)
+        text = f.read(length + 5).decode()
+    if text.startswith(head):
+        try:
+            return json.loads(text[len(head):])
+        except ValueError:
+            pass
+    return read_snapshot(path).get(name)
+
+# flock on a side file for the block; yields the open file, or None when
+# wait=False and someone else holds it. Each use opens its own descriptor,
+# so threads of one process exclude each other as well.
+@contextlib.contextmanager
+def locked(path, shared=False, wait=True):
+    with open(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), "r+") as f:
+        if fcntl is not None:
+            try:
+                fcntl.flock(f, (fcntl.LOCK_SH if shared else fcntl.LOCK_EX) | (0 if wait else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield None
+                return
+        yield f
+
+class Journal:
+    def __init__(self, snapshot, path=None, compact_bytes=COMPACT_BYTES):
+        self.snapshot = snapshot
+        self.path = path or os.path.splitext(snapshot)[0] + ".journal"
+        self.merging = self.path + ".merging"
+        self.compact_bytes = compact_bytes
+        self.lockfile = snapshot + ".lock"
+        self.compacting = snapshot + ".compact.lock"
+        self.lock = threading.Lock()
+        self.compactor = None
+
+    @contextlib.contextmanager
+    def _locked(self, shared=False):
+        with self.lock, locked(self.lockfile, shared) as f:
+            yield f
+
+    # holds the lock so a compaction cannot swap files halfway through
+    def load(self):
+        with self._locked(shared=True):
+            users = read_snapshot(self.snapshot)
+            replay(users, self.merging)
+            return replay(users, self.path)
+
+    def load_user(self, name):
+        with self._locked(shared=True):
+            users = {}
+            user = read_user(self.snapshot, name)
+            if user is not None:
+                users[name] = user
+            replay(users, self.merging, name)
+            return replay(users, self.path, name).get(name)
+
+    # Rewrites the snapshot with an index when it has none or a stale one
+    # (users.json from before indexes, or edited by hand), so lookups do not
+    # fall back to parsing the whole file until the first compaction.
+    def ensure_index(self):
+        if not os.path.exists(self.snapshot) or index_current(self.snapshot):
+            return
+        with locked(self.compacting):
+            if index_current(self.snapshot):
+                return
+            tmp = write_snapshot(self.snapshot, read_snapshot(self.snapshot))
+            with self._locked():
+                install_snapshot(tmp, self.snapshot)
+
+    # seqs only need to grow; the lock file keeps the last one, so they grow
+    # across processes and restarts even if the clock steps back
+    def _next_seq(self, lockfile):
+        lockfile.seek(0)
+        try:
+            last = int(lockfile.read() or 0)
+        except ValueError:
+            last = 0
+        seq = max(last + 1, time.time_ns())
+        # fixed width, so it overwrites the old value without a truncate
+        lockfile.seek(0)
+        lockfile.write(f"{seq:020d}")
+        lockfile.flush()
+        return seq
+
+    # One line per entry, written whole under the exclusive lock. After a
+    # torn last line the entry starts on a fresh line, so only the torn
+    # one is lost.
+    def append(self, entry):
+        with self._locked() as lockfile:
+            entry = dict(entry, seq=self._next_seq(lockfile))
+            line = (json.dumps(entry) + "\n").encode()
+            with open(self.path, "a+b") as f:
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+                size = f.tell()
+        if size >= self.compact_bytes:
+            self.compact_async()
+
+    def put(self, name, password, data):
+        self.append({"user": name, "op": "put", "password": password, "data": data})
+
+    # replaces everything: a fresh snapshot and an empty journal
+    def save(self, users):
+        self.close()
+        with locked(self.compacting):
+            tmp = write_snapshot(self.snapshot, users)
+            with self._locked():
+                install_snapshot(tmp, self.snapshot)
+                for path in (self.merging, self.path):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    # waits for a running compaction, so none is cut off at exit
+    def close(self):
+        if self.compactor is not None:
+            self.compactor.join()
+
+    def compact_async(self):
+        with self.lock:
+            if self.compactor is not None and self.compactor.is_alive():
+                return
+            self.compactor = threading.Thread(target=self.compact, daemon=True)
+            self.compactor.start()
+
+    # Moves the journal aside (new appends start a fresh one), merges it into
+    # the snapshot, then drops it. Appends wait only for the renames. Skipped
+    # while another process compacts; its journal gets the next turn.
+    def compact(self):
+        with locked(self.compacting, wait=False) as mine:
+            if mine is None:
+                return
+            with self._locked():
+                if not os.path.exists(self.merging):
+                    if not os.path.exists(self.path):
+                        return
+                    os.replace(self.path, self.merging)
+            tmp = write_snapshot(self.snapshot, replay(read_snapshot(self.snapshot), self.merging))
+            with self._locked():
+                install_snapshot(tmp, self.snapshot)
+                os.remove(self.merging)
@@ -0,0 +1,106 @@
+import os
+import re
+import sys
+
+# Precomputed verb/noun lemmas for the words the symptom index can match.
+# Built offline with NLTK's WordNet lemmatizer (python3 lexicon.py) and
+# shipped as lexicon.tsv, so answering queries never touches NLTK.
+# Words missing from the table are their own lemma, which is what WordNet
+# says for most of them; the table only lists words whose lemma differs.
+
+LEXICON_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lexicon.tsv")
+
+TOKEN = re.compile(r"(?u)\b\w\w+\b")
+
+# a text's lowercase words, punctuation stripped ("fatigue," -> "fatigue");
+# underscores split words too, so they only ever join phrase features
+WORD = re.compile(r"[^\W_]+(?:['’][^\W_]+)*")
+
+def words(text):
+    return WORD.findall(text.lower())
+
+_table = None
+
+def load_lexicon(path=LEXICON_FILE):
+    table = {}
+    if not os.path.exists(path):
+        return table
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#"):
+                continue
+            word, verb, noun = line.rstrip("\n").split("\t")
+            table[word] = (verb or word, noun or word)
+    return table
+
+def lemmas(word):
+    global _table
+    if _table is None:
+        _table = load_lexicon()
+    return _table.get(word, (word, word))
+
+def _forms(term):
+    yield term
+    for suffix in ("s", "es", "ed", "d", "ing", "er", "ers"):
+        yield term + suffix
+    if term.endswith("e"):
+        yield term[:-1] + "ing"
+    if term.endswith("y"):
+        yield term[:-1] + "ies"
+        yield term[:-1] + "ied"
+    if len(term) > 2 and term[-1] not in "aeiouwxy" and term[-2] in "aeiou":
+        yield term + term[-1] + "ed"
+        yield term + term[-1] + "ing"
+
+def build_lexicon(texts, path=LEXICON_FILE):
+    from nltk.stem import WordNetLemmatizer
+    from nltk.corpus import wordnet
+
+    lem = WordNetLemmatizer()
+
+    def lemmatize(word):
+        return lem.lemmatize(word, pos=wordnet.VERB), lem.lemmatize(word, pos=wordnet.NOUN)
+
+    surface = {word for text in texts for word in words(text)}
+    vocab = set()
+    for word in surface:
+        for form in (word,) + lemmatize(word):
+            vocab.update(TOKEN.findall(form))
+
+    # every surface form that lemmatizes onto something the index knows
+    candidates = set(surface)
+    for term in vocab:
+        candidates.update(_forms(term))
+    wordnet.ensure_loaded()
+    for pos in (wordnet.VERB, wordnet.NOUN):
+        for form, bases in wordnet._exception_map[pos].items():
+            if vocab.intersection(bases):
+                candidates.add(form)
+
+    rows = []
+    for word in sorted(candidates):
+        verb, noun = lemmatize(word)
+        if verb == word and noun == word:
+            continue
+        if not vocab.intersection(TOKEN.findall(" ".join((word, verb, noun)))):
+            continue
+        rows.append((word, "" if verb == word else verb, "" if noun == word else noun))
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# word\tverb lemma\tnoun lemma (empty = same as word)\n")
+        for row in rows:
+            f.write("\t".join(row) + "\n")
+    return len(rows)
+
+# built from CONDITIONS_FILE when it is set, otherwise from main.symp; words
+# the table never saw are their own lemma, so rebuild after switching lists
+if __name__ == "__main__":
+    import main
+    import conditions
+
+    if main.CONDITIONS_FILE:
+        texts = (symptoms for _, symptoms in conditions.read_conditions(main.CONDITIONS_FILE))
+    else:
+        texts = main.symp
+    n = build_lexicon(texts, sys.argv[1] if len(sys.argv) > 1 else LEXICON_FILE)
+    print(f"wrote {n} entries")
@@ -1,49 +1,411 @@
+import os
+import json
 import sys
+import math
+import hashlib
+import itertools
+import threading
+import functools
+import multiprocessing
+from collections import deque
 
-def backend(insx, titles, descps):
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.neighbors import KNeighborsClassifier
-    from nltk.stem import WordNetLemmatizer
-    from nltk.corpus import wordnet
-    import nltk
-
-    nltk.download("wordnet")
-    nltk.download("omw-1.4")
-
-    def derive(texts):
-        lem = WordNetLemmatizer() 
-        devd = []
+import numpy as np
+from scipy import sparse
+
+import ann
+import inverted
+import lexicon
+import phrases
+import artifact
+import conditions
+from cache import QueryCache
+from index import ConditionIndex, BUILD_CHUNK, chunked, count_rows
+
+MODEL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "model.bin")
+
+# processes used to lemmatize and count a large condition list
+BUILD_WORKERS = int(os.environ.get("BUILD_WORKERS", os.cpu_count() or 1))
+
+# approximate search: recall target for the LSH candidate stage, unset = exact
+ANN_RECALL = float(os.environ["ANN_RECALL"]) if os.environ.get("ANN_RECALL") else None
+
+# exact pruning: score only conditions sharing a term with the query
+INVERTED_INDEX = os.environ.get("INVERTED_INDEX", "") not in ("", "0")
+
+# optional external condition list (JSONL or CSV) used instead of `stuff`
+CONDITIONS_FILE = os.environ.get("CONDITIONS_FILE")
+
+LEMMA_CACHE_SIZE = 8192
+
+# answers to repeated queries, keyed on their lemmatized terms
+QUERY_CACHE_SIZE = int(os.environ.get("QUERY_CACHE_SIZE", 4096))
+QUERY_CACHE_TTL = float(os.environ.get("QUERY_CACHE_TTL", 300))
+
+# live condition edits, one JSON line each, replayed onto the default model
+# at startup so they survive a worker restart; kept per condition list
+def edits_path(conditions_file=None):
+    if conditions_file is None:
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), "conditions.edits.jsonl")
+    return conditions_file + ".edits.jsonl"
+
+# printed when no condition shares a term with the input
+NO_MATCH = "no match"
+
+# verb + noun expansion of one lowercase token, as used by derive()
+@functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def expand(word):
+    return " ".join(lexicon.lemmas(word))
+
+def lemma_cache_info():
+    return expand.cache_info()
+
+def derive(texts):
+    devd = []
+    for text in texts:
+        words = lexicon.words(text)
+        combined = " ".join(expand(word) for word in words)
+        devd.append(combined)
+    return devd
+
+# a description's index terms: word lemmas plus its own phrase features
+def terms(text):
+    return lexicon.TOKEN.findall(derive([text])[0].lower()) + phrases.described(text)
+
+def _count_chunk(chunk):
+    return count_rows((title, terms(descp)) for title, descp in chunk)
+
+# count_rows() results for each chunk, in order. Corpora bigger than two
+# chunks are spread over a process pool, with a bounded number of chunks in
+# flight so a streamed file is not read ahead into memory.
+def _count_chunks(chunks, workers):
+    head = list(itertools.islice(chunks, 2))
+    if workers <= 1 or len(head) < 2:
+        yield from map(_count_chunk, itertools.chain(head, chunks))
+        return
+    with multiprocessing.Pool(workers) as pool:
+        window = deque()
+        for chunk in itertools.chain(head, chunks):
+            window.append(pool.apply_async(_count_chunk, (chunk,)))
+            if len(window) >= 2 * workers:
+                yield window.popleft().get()
+        while window:
+            yield window.popleft().get()
+
+# A fitted model is an editable ConditionIndex (vocabulary, IDF weights and
+# the weighted symptom matrix); answering queries needs NumPy/SciPy only.
+class DiagnosisModel:
+    def __init__(self, index):
+        self.index = index
+        self.phrases = phrases.PhraseTrie.from_terms(index.terms)
+        self.cache = QueryCache(QUERY_CACHE_SIZE, QUERY_CACHE_TTL)
+        # set once default_model() has replayed the edits file and applied
+        # ANN_RECALL / INVERTED_INDEX (also when calibration kept exact search)
+        self.configured = False
+
+    @classmethod
+    def build(cls, titles, descps):
+        return cls.from_rows(zip(titles, descps))
+
+    # rows is any iterable of (title, description), read once
+    @classmethod
+    def from_rows(cls, rows, workers=None):
+        chunks = _count_chunks(chunked(rows, BUILD_CHUNK), BUILD_WORKERS if workers is None else workers)
+        return cls(ConditionIndex.merge(chunks))
+
+    @property
+    def vocabulary(self):
+        return self.index.vocabulary
+
+    @property
+    def idf(self):
+        return self.index.idf
+
+    # score only LSH candidates, with enough tables to reach `recall` on
+    # partial-symptom queries sampled from the index. Stays exact when no LSH
+    # setting is faster than scoring every row; None goes back to exact.
+    def use_ann(self, recall=0.95, **kwargs):
+        if recall is None:
+            self.index.set_prefilter(None)
+        else:
+            lsh = ann.calibrate(self.index.matrix, recall, **kwargs)
+            self.index.set_prefilter(lsh)
+            if lsh is None:
+                sys.stderr.write(f"ann: exact search is faster than LSH at recall {recall}, staying exact\n")
+            else:
+                sys.stderr.write(
+                    f"ann: {lsh.tables} tables x {lsh.bits} bits, {lsh.probes} probes, "
+                    f"expected recall {lsh.expected_recall:.3f}\n"
+                )
+        self.cache.clear()
+
+    # which search answers queries, for /stats
+    def search_stats(self):
+        prefilter = self.index.prefilter
+        if prefilter is None:
+            return {"search": "exact"}
+        if isinstance(prefilter, ann.LSHIndex):
+            return {
+                "search": "ann",
+                "tables": prefilter.tables,
+                "bits": prefilter.bits,
+                "probes": prefilter.probes,
+                "expected_recall": getattr(prefilter, "expected_recall", None),
+            }
+        return {"search": "inverted"}
+
+    # score only conditions sharing at least one term with the query (exact)
+    def use_inverted_index(self, on=True):
+        self.index.set_prefilter(inverted.InvertedIndex() if on else None)
+        self.cache.clear()
+
+    def add_condition(self, title, descp):
+        self.index.add(title, terms(descp))
+        self.phrases.add_text(descp)
+
+    def remove_condition(self, title):
+        self.index.remove(title)
+
+    # same weighting as TfidfVectorizer.transform: raw counts x idf, L2 norm
+    def weigh(self, terms):
+        counts = {}
+        for term in terms:
+            j = self.vocabulary.get(term)
+            if j is not None:
+                counts[j] = counts.get(j, 0) + 1
+        weights = [(j, c * self.idf[j]) for j, c in sorted(counts.items())]
+        norm = math.sqrt(sum(w * w for _, w in weights)) or 1.0
+        return [j for j, _ in weights], [w / norm for _, w in weights]
+
+    # derive() of a query plus the known phrases in it
+    def expand_query(self, text):
+        segs = phrases.segments(text)
+        return " ".join([expand(word) for seg in segs for word in seg] + self.phrases.walk(segs))
+
+    def query_terms(self, text):
+        return lexicon.TOKEN.findall(self.expand_query(text))
+
+    def vectorize(self, texts):
+        indptr, indices, data = [0], [], []
         for text in texts:
-            words = text.split()
-            combined = " ".join(
-                lem.lemmatize(word.lower(), pos=wordnet.VERB) + " " + 
-                lem.lemmatize(word.lower(), pos=wordnet.NOUN) 
-                for word in words
-            )
-            devd.append(combined)
-        return devd
+            cols, vals = self.weigh(self.query_terms(text))
+            indices.extend(cols)
+            data.extend(vals)
+            indptr.append(len(indices))
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, len(self.vocabulary)))
+
+    # one query as a dense vector, cheaper than a 1-row sparse matrix
+    def vector(self, text, terms=None):
+        cols, vals = self.weigh(self.query_terms(text) if terms is None else terms)
+        q = np.zeros(len(self.vocabulary))
+        q[cols] = vals
+        return q
+
+    # answers fn(query vector) from the cache when the same terms were
+    # asked before, in any order or inflection
+    def _cached(self, name, ina, fn):
+        terms = self.query_terms(ina)
+        key = (name, tuple(sorted(terms)))
+        version = self.index.version
+        # boxed, since None is a result too (no match)
+        found = self.cache.get(key, version)
+        if found is None:
+            found = (fn(self.vector(ina, terms)),)
+            self.cache.put(key, found, version)
+        return found[0]
+
+    def predict(self, ina):
+        return self._cached("predict", ina, self.index.predict)
+
+    def predict_batch(self, texts):
+        return self.index.predict_batch(self.vectorize(texts))
+
+    def rank(self, ina, k=3):
+        return list(self._cached(("rank", k), ina, lambda q: tuple(self.index.top(q, k))))
+
+def _hash_lexicon(h):
+    if os.path.exists(lexicon.LEXICON_FILE):
+        with open(lexicon.LEXICON_FILE, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+# identifies what a saved model was built from: the conditions and the lexicon
+def corpus_hash(titles, descps):
+    h = hashlib.sha256()
+    for title, descp in zip(titles, descps):
+        h.update(title.encode("utf-8") + b"\0" + descp.encode("utf-8") + b"\0")
+    return _hash_lexicon(h)
+
+def file_hash(path):
+    h = hashlib.sha256(b"file\0")
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return _hash_lexicon(h)
+
+# path None: fit in memory only
+def _load_or_build(digest, build, path):
+    if path is None:
+        return build()
+    try:
+        return DiagnosisModel(ConditionIndex(*artifact.load(path, digest)))
+    except (OSError, ValueError, KeyError, artifact.ArtifactError):
+        pass
+    model = build()
+    try:
+        artifact.save(path, model, digest)
+    except OSError as e:
+        sys.stderr.write(f"could not save {path}: {e}\n")
+    return model
+
+# where a condition list's model is saved: model.bin for the built-in list,
+# model-<path hash>.bin per CONDITIONS_FILE, so switching between them does
+# not overwrite the other's artifact
+def model_path(conditions_file=None):
+    if conditions_file is None:
+        return MODEL_FILE
+    tag = hashlib.sha256(os.path.abspath(conditions_file).encode("utf-8")).hexdigest()[:12]
+    return f"{os.path.splitext(MODEL_FILE)[0]}-{tag}.bin"
+
+# loads the saved model if it matches, otherwise fits one and saves it
+def load_model(titles, descps, path=MODEL_FILE):
+    return _load_or_build(corpus_hash(titles, descps), lambda: DiagnosisModel.build(titles, descps), path)
 
-    def search(inn):
+def load_model_file(conditions_file, path=None):
+    path = model_path(conditions_file) if path is None else path
+    return _load_or_build(
+        file_hash(conditions_file),
+        lambda: DiagnosisModel.from_rows(conditions.read_conditions(conditions_file)),
+        path,
+    )
 
-        derive_descps = derive(descps) 
+# fitted models, keyed by the condition list they were built from; the lock
+# makes concurrent first calls (the web apps' thread pools) build once. Only
+# the built-in list is saved; other lists passed in are fitted in memory.
+_models = {}
+_models_lock = threading.RLock()
 
-        vec = TfidfVectorizer() 
-        vector_descps = vec.fit_transform(derive_descps) 
+def get_model(titles, descps):
+    key = (tuple(titles), tuple(descps))
+    with _models_lock:
+        if key not in _models:
+            builtin = list(titles) == cond and list(descps) == symp
+            _models[key] = load_model(titles, descps, MODEL_FILE if builtin else None)
+        return _models[key]
 
-        main_m = KNeighborsClassifier(n_neighbors=1) 
-        main_m.fit(vector_descps, titles) 
+def get_model_file(conditions_file):
+    key = ("file", os.path.abspath(conditions_file))
+    with _models_lock:
+        if key not in _models:
+            _models[key] = load_model_file(conditions_file)
+        return _models[key]
 
+# CONDITIONS_FILE if set, otherwise the built-in `stuff` list
+def default_model():
+    with _models_lock:
+        model = get_model_file(CONDITIONS_FILE) if CONDITIONS_FILE else get_model(cond, symp)
+        if not model.configured:
+            _replay_edits(model, edits_path(CONDITIONS_FILE))
+            if ANN_RECALL is not None:
+                model.use_ann(ANN_RECALL)
+            elif INVERTED_INDEX:
+                model.use_inverted_index()
+            model.configured = True
+        return model
 
-        def search_model(ina):
-            d_ina = derive([ina])[0] 
-            ina_vec = vec.transform([d_ina]) 
-            prediction = main_m.predict(ina_vec) 
-            return prediction[0]
+def _replay_edits(model, path):
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                edit = json.loads(line)
+            except ValueError:
+                # a torn last line from a crash mid-append
+                continue
+            try:
+                if edit["op"] == "add":
+                    model.add_condition(edit["condition"], edit["symptoms"])
+                else:
+                    model.remove_condition(edit["condition"])
+            except KeyError:
+                # removes a condition the list no longer has
+                continue
 
-        final = search_model(insx)
-        return final
+def _log_edit(edit):
+    with open(edits_path(CONDITIONS_FILE), "a", encoding="utf-8") as f:
+        f.write(json.dumps(edit) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
 
-    return search(insx)
+def _model(titles, descps):
+    if titles is None and descps is None:
+        return default_model()
+    return get_model(cond if titles is None else titles, symp if descps is None else descps)
+
+def backend(insx, titles, descps):
+    return get_model(titles, descps).predict(insx)
+
+def diagnose(insx):
+    return default_model().predict(insx)
+
+# the k best matching conditions as (condition, cosine score), best first
+def diagnose_top(insx, k=3, titles=None, descps=None):
+    return _model(titles, descps).rank(insx, k)
+
+MAX_K = 10
+
+# the web apps' answer for a ranked request (k given): the best condition
+# and up to k matches with their scores, or None when nothing matched
+def ranked_result(insx, k):
+    ranking = diagnose_top(insx, max(1, min(k, MAX_K)))
+    if not ranking:
+        return None
+    return {"diagnosis": ranking[0][0], "ranking": [{"condition": c, "score": s} for c, s in ranking]}
+
+# live edits to the default model, logged once applied; a title that
+# already exists is replaced
+def add_condition(title, descp):
+    with _models_lock:
+        default_model().add_condition(title, descp)
+        _log_edit({"op": "add", "condition": title, "symptoms": descp})
+
+def remove_condition(title):
+    with _models_lock:
+        default_model().remove_condition(title)
+        _log_edit({"op": "remove", "condition": title})
+
+# the default model's search (exact, ann with its expected recall, or
+# inverted) plus hit ratios and sizes of its query cache and the lemma cache
+def cache_stats():
+    lemma = lemma_cache_info()
+    lookups = lemma.hits + lemma.misses
+    model = default_model()
+    return {
+        "search": model.search_stats(),
+        "queries": model.cache.stats(),
+        "lemmas": {
+            "size": lemma.currsize,
+            "maxsize": lemma.maxsize,
+            "hits": lemma.hits,
+            "misses": lemma.misses,
+            "hit_ratio": lemma.hits / lookups if lookups else 0.0,
+        },
+    }
+
+BATCH_SIZE = 4096
+
+# diagnoses for any iterable of symptom strings, yielded in input order;
+# each chunk of batch_size texts is one transform and one neighbour search
+def diagnose_batch(texts, titles=None, descps=None, batch_size=BATCH_SIZE):
+    model = _model(titles, descps)
+    chunk = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) == batch_size:
+            yield from model.predict_batch(chunk)
+            chunk = []
+    if chunk:
+        yield from model.predict_batch(chunk)
 
 stuff = [  
 
@@ -84,17 +446,35 @@ symp = [i[1] for i in stuff]
 
 
 def main():
-    try:
-        with open('user_input.txt', 'r') as input_file:
-            user_input = input_file.readline().strip()
+    if sys.argv[1:2] == ["--rebuild"]:
+        path = sys.argv[2] if len(sys.argv) > 2 else model_path(CONDITIONS_FILE)
+        if CONDITIONS_FILE:
+            model = DiagnosisModel.from_rows(conditions.read_conditions(CONDITIONS_FILE))
+            artifact.save(path, model, file_hash(CONDITIONS_FILE))
+        else:
+            artifact.save(path, DiagnosisModel.build(cond, symp), corpus_hash(cond, symp))
+        print(f"wrote {path}")
+        return
+
+    if sys.argv[1:2] == ["--batch"]:
+        # one symptom report per line in, one diagnosis per line out
+        input_file = open(sys.argv[2], "r") if len(sys.argv) > 2 else sys.stdin
+        with input_file:
+            lines = (line.strip() for line in input_file)
+            for oop in diagnose_batch(lines):
+                print(NO_MATCH if oop is None else oop)
+        return
 
-        with open('output.txt', 'w') as output_file:
-            oop = backend(user_input, cond, symp)
-            output_file.write(oop)
+    if len(sys.argv) > 1:
+        user_input = " ".join(sys.argv[1:])
+    else:
+        user_input = sys.stdin.readline().strip()
 
+    try:
+        oop = diagnose(user_input)
+        print(NO_MATCH if oop is None else oop)
     except Exception as e:
-        with open('output.txt', 'w') as output_file:
-            output_file.write(f"Error: {str(e)}")
+        print(f"Error: {str(e)}")
 
 if __name__ == "__main__":
     main()
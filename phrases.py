@@ -0,0 +1,74 @@
+import re
+import functools
+
+import lexicon
+
+# Multi-word symptom phrases ("shortness of breath", "chest pain") as single
+# features. Descriptions are split into segments at punctuation, and every
+# segment of 2..MAX_WORDS words is a phrase of that condition. Queries are
+# matched against the phrases the index knows with a trie walk over the
+# same segments, so a query phrase never spans a comma. Words are compared
+# by verb lemma ("muscle aches" == "muscle ache"), and a phrase becomes the
+# feature "muscle_ache".
+
+MAX_WORDS = 4
+
+# punctuation that ends a segment; apostrophes and hyphens do not
+SEGMENT = re.compile(r"[^\w\s'’-]+")
+
+def segments(text):
+    return [lexicon.WORD.findall(part) for part in SEGMENT.split(text.lower())]
+
+# apostrophes dropped, so a feature is a single index token
+@functools.lru_cache(maxsize=8192)
+def key(word):
+    return re.sub(r"\W", "", lexicon.lemmas(word)[0])
+
+def feature(keys):
+    return "_".join(keys)
+
+# the phrase features of one condition description
+def described(text):
+    return [feature([key(w) for w in seg]) for seg in segments(text) if 2 <= len(seg) <= MAX_WORDS]
+
+class PhraseTrie:
+    def __init__(self, phrases=()):
+        self.root = {}
+        for keys in phrases:
+            self.add(keys)
+
+    # the phrases among an index's terms
+    @classmethod
+    def from_terms(cls, terms):
+        return cls(term.split("_") for term in terms if "_" in term)
+
+    def add(self, keys):
+        node = self.root
+        for k in keys:
+            node = node.setdefault(k, {})
+        node[""] = feature(keys)
+
+    def add_text(self, text):
+        for term in described(text):
+            self.add(term.split("_"))
+
+    # leftmost-longest phrase matches in each of a query's segments()
+    def walk(self, segs):
+        found = []
+        for seg in segs:
+            keys = [key(w) for w in seg]
+            i = 0
+            while i < len(keys):
+                node, match, end = self.root, None, i
+                for j in range(i, len(keys)):
+                    node = node.get(keys[j])
+                    if node is None:
+                        break
+                    if "" in node:
+                        match, end = node[""], j + 1
+                if match is None:
+                    i += 1
+                else:
+                    found.append(match)
+                    i = end
+        return found
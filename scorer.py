@@ -0,0 +1,69 @@
+import numpy as np
+
+# Nearest-condition search over L2-normalized TF-IDF rows. Cosine similarity
+# is a plain sparse dot product, so this replaces KNeighborsClassifier with
+# one CSR product per query (or per batch). Ties, including queries that
+# match nothing, go to the lowest row.
+
+# upper bound on a dense queries x conditions block in predict_batch
+DENSE_BLOCK = 1 << 22
+
+class CosineScorer:
+    def __init__(self, matrix, labels):
+        self.matrix = matrix.tocsr()
+        self.labels = list(labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    # qvec is a 1-row sparse matrix or a dense 1-D array
+    def scores(self, qvec):
+        if hasattr(qvec, "toarray"):
+            qvec = qvec.toarray().ravel()
+        return self.matrix @ qvec
+
+    # queries x conditions, dense
+    def block_scores(self, qvecs):
+        return (qvecs @ self.matrix.T).toarray()
+
+    # (rows, scores) for the rows worth scoring; every row here
+    def scored(self, qvec):
+        scores = self.scores(qvec)
+        return np.arange(len(scores)), scores
+
+    # None when nothing matched: every score is 0 (or -1 for removed rows)
+    def predict(self, qvec):
+        rows, scores = self.scored(qvec)
+        best = np.argmax(scores)
+        if scores[best] <= 0:
+            return None
+        return self.labels[int(rows[best])]
+
+    def predict_batch(self, qvecs):
+        qvecs = qvecs.tocsr()
+        step = max(1, DENSE_BLOCK // max(1, len(self)))
+        best = []
+        for start in range(0, qvecs.shape[0], step):
+            sims = self.block_scores(qvecs[start:start + step])
+            idx = sims.argmax(axis=1)
+            matched = sims[np.arange(len(idx)), idx] > 0
+            best.extend(int(i) if hit else None for i, hit in zip(idx, matched))
+        return [None if i is None else self.labels[i] for i in best]
+
+    def top(self, qvec, k):
+        rows, scores = self.scored(qvec)
+        k = min(k, len(scores))
+        if k < len(scores):
+            # everything above the k-th score, then the lowest tied rows
+            kth = -np.partition(-scores, k - 1)[k - 1]
+            above = np.flatnonzero(scores > kth)
+            tied = np.flatnonzero(scores == kth)
+            idx = np.concatenate([above, tied[np.argsort(rows[tied])][:k - len(above)]])
+        else:
+            idx = np.arange(len(scores))
+        idx = idx[np.lexsort((rows[idx], -scores[idx]))]
+        # only conditions that matched at all; may be fewer than k
+        return [
+            (self.labels[rows[i]], float(scores[i])) for i in idx
+            if scores[i] > 0 and self.labels[rows[i]] is not None
+        ]
@@ -1,7 +1,8 @@
 const express = require('express');
-const { exec } = require('child_process');
-const fs = require('fs');
+const { spawn } = require('child_process');
+const crypto = require('crypto');
 const path = require('path');
+const readline = require('readline');
 const app = express();
 
 const cors = require('cors');
@@ -10,27 +11,199 @@ app.use(cors());
 app.use(express.json());
 app.use(express.static(__dirname));
 
-app.post('/reload', (req, res) => {
-    exec('rm -rf output.txt && touch output.txt');
-});
+// resident python worker (worker.py), talks JSON lines over stdin/stdout
+let worker = null;
+let nextId = 1;
+const pending = new Map();
+
+function startWorker() {
+    const proc = spawn('python3', [path.join(__dirname, 'worker.py')], {
+        cwd: __dirname,
+        stdio: ['pipe', 'pipe', 'inherit']
+    });
+    worker = proc;
+    readline.createInterface({ input: proc.stdout }).on('line', (line) => {
+        let msg;
+        try {
+            msg = JSON.parse(line);
+        } catch (err) {
+            console.error('bad worker output', line);
+            return;
+        }
+        const cb = pending.get(msg.id);
+        if (cb) {
+            pending.delete(msg.id);
+            cb(msg);
+        }
+    });
+    // EPIPE once the worker has died; 'exit' (or 'error') cleans up
+    proc.stdin.on('error', (err) => {
+        console.error('worker stdin:', err.message);
+    });
+    proc.on('error', (err) => workerGone(proc, err.message));
+    proc.on('exit', (code) => workerGone(proc, `exited (${code})`));
+}
+
+// fails everything in flight and restarts; requests until then fail at once
+function workerGone(proc, why) {
+    if (worker !== proc) {
+        return;
+    }
+    worker = null;
+    console.error(`worker ${why}, restarting`);
+    for (const cb of pending.values()) {
+        cb({ error: 'worker exited' });
+    }
+    pending.clear();
+    setTimeout(startWorker, 1000);
+}
+
+function ask(req, cb) {
+    if (!worker) {
+        cb({ error: 'worker unavailable' });
+        return;
+    }
+    const id = nextId++;
+    pending.set(id, cb);
+    worker.stdin.write(JSON.stringify({ ...req, id }) + '\n');
+}
+
+// with k, the worker also sends the k best matches
+function diagnose(input, k, cb) {
+    ask(k ? { input, k } : { input }, cb);
+}
+
+startWorker();
+
+// per-request results, kept until RESULT_TTL after they complete
+const RESULT_TTL = 5 * 60 * 1000;
+const POLL_TIMEOUT = 25 * 1000;
+const jobs = new Map();
+
+function finishJob(job, msg) {
+    job.done = true;
+    job.error = msg.error || null;
+    job.result = msg.error ? null : msg.diagnosis;
+    job.ranking = msg.error || !msg.ranking ? null : msg.ranking.map(([condition, score]) => ({ condition, score }));
+    for (const waiter of job.waiters) {
+        waiter();
+    }
+    job.waiters = [];
+    setTimeout(() => jobs.delete(job.id), RESULT_TTL);
+}
+
+// 204 when no condition matched the input; JSON with the ranking when the
+// job was asked for k matches
+function sendJob(job, res) {
+    if (job.error) {
+        res.status(500).send(`Error: ${job.error}`);
+    } else if (job.result === null || job.result === undefined) {
+        res.status(204).send('');
+    } else if (job.k) {
+        res.json({ diagnosis: job.result, ranking: job.ranking });
+    } else {
+        res.send(job.result);
+    }
+}
+
+const MAX_K = 10;
 
 app.post('/update-python', (req, res) => {
     const usi = req.body.input;
-    const usiFP = path.join(__dirname, 'user_input.txt');
-    const opFP = path.join(__dirname, 'output.txt');
+    const k = req.body.k;
+    if (k !== undefined && k !== null && !(Number.isInteger(k) && k >= 1)) {
+        res.status(400).send('k must be a positive integer');
+        return;
+    }
+    const job = {
+        id: crypto.randomUUID(), k: k ? Math.min(k, MAX_K) : null,
+        done: false, result: null, ranking: null, error: null, waiters: []
+    };
+    jobs.set(job.id, job);
+
+    diagnose(String(usi || ''), job.k, (msg) => finishJob(job, msg));
+    res.json({ message: 'Data received', id: job.id });
+});
+
+// long-poll: answers as soon as the job completes, or 202 after POLL_TIMEOUT
+app.get('/output/:id', (req, res) => {
+    const job = jobs.get(req.params.id);
+    if (!job) {
+        res.status(404).send('unknown request id');
+        return;
+    }
+    if (job.done) {
+        sendJob(job, res);
+        return;
+    }
+    const waiter = () => {
+        clearTimeout(timer);
+        sendJob(job, res);
+    };
+    const timer = setTimeout(() => {
+        job.waiters = job.waiters.filter((w) => w !== waiter);
+        res.status(202).send('pending');
+    }, POLL_TIMEOUT);
+    job.waiters.push(waiter);
+});
+
+// Condition edits need "Authorization: Bearer $ADMIN_TOKEN"; with no
+// ADMIN_TOKEN set they are switched off.
+const ADMIN_TOKEN = process.env.ADMIN_TOKEN || '';
+
+function requireAdmin(req, res) {
+    if (!ADMIN_TOKEN) {
+        res.status(403).send('condition edits are disabled (set ADMIN_TOKEN)');
+        return false;
+    }
+    const given = Buffer.from(req.headers.authorization || '');
+    const expected = Buffer.from(`Bearer ${ADMIN_TOKEN}`);
+    if (given.length !== expected.length || !crypto.timingSafeEqual(given, expected)) {
+        res.status(401).send('admin token required');
+        return false;
+    }
+    return true;
+}
 
-    fs.writeFile(usiFP, usi, (writeErr) => {
-        exec('python3 main.py');
+// live edits to the condition list; the worker logs them so they outlive it
+app.post('/conditions', (req, res) => {
+    if (!requireAdmin(req, res)) {
+        return;
+    }
+    const { condition, symptoms } = req.body;
+    if (!condition || !symptoms) {
+        res.status(400).send('condition and symptoms are required');
+        return;
+    }
+    ask({ op: 'add', condition, symptoms }, (msg) => {
+        if (msg.error) {
+            res.status(500).send(`Error: ${msg.error}`);
+        } else {
+            res.json({ message: 'Condition saved' });
+        }
+    });
+});
+
+app.delete('/conditions/:name', (req, res) => {
+    if (!requireAdmin(req, res)) {
+        return;
+    }
+    ask({ op: 'remove', condition: req.params.name }, (msg) => {
+        if (msg.error) {
+            res.status(404).send(`Error: ${msg.error}`);
+        } else {
+            res.json({ message: 'Condition removed' });
+        }
     });
 });
 
-app.get('/output', (req, res) => {
-    const opFP = path.join(__dirname, 'output.txt');
-    fs.readFile(opFP, 'utf8', (readErr, data) => {
-        if (readErr) {
-            res.status(500).send('couldnt read output.txt');
+// query/lemma cache hit ratios and memory
+app.get('/stats', (req, res) => {
+    ask({ op: 'stats' }, (msg) => {
+        if (msg.error) {
+            res.status(500).send(`Error: ${msg.error}`);
         } else {
-            res.send(data);
+            res.json(msg.stats);
         }
     });
 });
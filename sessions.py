@@ -0,0 +1,31 @@
+import threading
+from collections import OrderedDict, deque
+
+# Server-side health records, keyed by session id. The session cookie only
+# carries the id, so its size stays the same however long the history gets.
+# Each session keeps its last max_records entries; past max_sessions the
+# least recently used session is dropped.
+
+class SessionStore:
+    def __init__(self, max_records=100, max_sessions=10000):
+        self.max_records = max_records
+        self.max_sessions = max_sessions
+        self.sessions = OrderedDict()
+        self.lock = threading.Lock()
+
+    def append(self, sid, record):
+        with self.lock:
+            records = self.sessions.get(sid)
+            if records is None:
+                records = self.sessions[sid] = deque(maxlen=self.max_records)
+            self.sessions.move_to_end(sid)
+            records.append(record)
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+
+    def records(self, sid):
+        with self.lock:
+            return list(self.sessions.get(sid, ()))
+
+    def __len__(self):
+        return len(self.sessions)
@@ -0,0 +1,272 @@
+import os
+import sys
+import json
+import shutil
+import sqlite3
+import hashlib
+
+from journal import COMPACT_BYTES, Journal
+
+# Storage backends for the health tracker (app2.py). Both keep the same
+# per-user shape as users.json:
+#
+#   {"password": ..., "data": {"weight_records": [...], ..., "daily_goals": {...}}}
+#
+# JsonStorage is users.json plus its journal. ShardedStorage splits users by
+# a hash of their name over a directory of such files, so different users
+# mostly write different files. SQLiteStorage keeps one row per user and one
+# row per record, so login, signup and a record touch only that user's rows.
+#
+#   python3 storage.py users.json health.db      copy users between stores
+#   python3 storage.py --rebalance users.d 64    change the bucket count
+
+# record lists and the columns of each record after "date"
+RECORD_FIELDS = {
+    "weight_records": ("weight",),
+    "meal_records": ("meal",),
+    "exercise_records": ("exercise", "duration_minutes"),
+    "water_records": ("amount_ml",),
+}
+
+def default_goals():
+    return {"steps": 10000, "water_ml": 2000}
+
+def _in_range(entry, since, until):
+    return (since is None or entry["date"] >= since) and (until is None or entry["date"] <= until)
+
+class JsonStorage:
+    def __init__(self, path, journal=None, compact_bytes=COMPACT_BYTES):
+        self.journal = Journal(path, journal, compact_bytes)
+        self.journal.ensure_index()
+
+    def close(self):
+        self.journal.close()
+
+    # the journal holding this user
+    def shard(self, name):
+        return self.journal
+
+    def load_all(self):
+        return self.journal.load()
+
+    def save_all(self, users):
+        self.journal.save(users)
+
+    def get_user(self, name):
+        return self.shard(name).load_user(name)
+
+    def exists(self, name):
+        return self.get_user(name) is not None
+
+    def put_user(self, name, password, data):
+        self.shard(name).put(name, password, data)
+
+    def append(self, name, field, entry):
+        self.shard(name).append({"user": name, "op": "append", "field": field, "value": entry})
+
+    def set_field(self, name, field, value):
+        self.shard(name).append({"user": name, "op": "set", "field": field, "value": value})
+
+    # dates are ISO strings, so ranges compare as text
+    def records(self, name, field, since=None, until=None):
+        user = self.get_user(name)
+        if user is None:
+            return []
+        return [e for e in user["data"].get(field, []) if _in_range(e, since, until)]
+
+BUCKETS = 16
+
+# Layout: root/meta.json names the bucket count n, and bucket b of n is
+# root/<n>/<b>.json with its own journal and index. Each bucket is written
+# like users.json (temp file, fsync, rename), so a crash mid-write loses
+# nothing and only that bucket's users share its files.
+class ShardedStorage(JsonStorage):
+    def __init__(self, root, buckets=BUCKETS, compact_bytes=COMPACT_BYTES):
+        self.root = root
+        self.compact_bytes = compact_bytes
+        self.meta = os.path.join(root, "meta.json")
+        if os.path.exists(self.meta):
+            with open(self.meta, "r") as f:
+                buckets = json.load(f)["buckets"]
+        else:
+            os.makedirs(root, exist_ok=True)
+            self._write_meta(buckets)
+        self._use(buckets)
+
+    def _use(self, buckets):
+        self.buckets = buckets
+        folder = os.path.join(self.root, str(buckets))
+        os.makedirs(folder, exist_ok=True)
+        self.shards = [
+            Journal(os.path.join(folder, f"{b}.json"), compact_bytes=self.compact_bytes) for b in range(buckets)
+        ]
+        for shard in self.shards:
+            shard.ensure_index()
+
+    def _write_meta(self, buckets):
+        tmp = f"{self.meta}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"buckets": buckets}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.meta)
+
+    # stable across processes, unlike hash()
+    def bucket(self, name):
+        digest = hashlib.blake2b(name.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self.buckets
+
+    def shard(self, name):
+        return self.shards[self.bucket(name)]
+
+    def close(self):
+        for shard in self.shards:
+            shard.close()
+
+    def load_all(self):
+        users = {}
+        for shard in self.shards:
+            users.update(shard.load())
+        return users
+
+    def save_all(self, users):
+        parts = [{} for _ in self.shards]
+        for name, user in users.items():
+            parts[self.bucket(name)][name] = user
+        for shard, part in zip(self.shards, parts):
+            shard.save(part)
+
+    # Writes every user into a fresh root/<buckets>/, then switches
+    # meta.json over and drops the old buckets. Until the switch, readers
+    # keep using the old layout; run it while the tracker is stopped.
+    def rebalance(self, buckets):
+        old = self.buckets
+        if buckets == old:
+            return
+        users = self.load_all()
+        shutil.rmtree(os.path.join(self.root, str(buckets)), ignore_errors=True)
+        self._use(buckets)
+        self.save_all(users)
+        self._write_meta(buckets)
+        shutil.rmtree(os.path.join(self.root, str(old)))
+
+class SQLiteStorage:
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS users ("
+                "name TEXT PRIMARY KEY, password TEXT NOT NULL, daily_goals TEXT NOT NULL)"
+            )
+            for field, columns in RECORD_FIELDS.items():
+                self.db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {field} ("
+                    f"id INTEGER PRIMARY KEY, user TEXT NOT NULL, date TEXT NOT NULL, {', '.join(columns)})"
+                )
+                self.db.execute(f"CREATE INDEX IF NOT EXISTS {field}_user_date ON {field} (user, date)")
+        # fixed statements with ? parameters; sqlite3 keeps them prepared
+        self.insert_sql = {
+            field: f"INSERT INTO {field} (user, date, {', '.join(columns)}) VALUES (?, ?{', ?' * len(columns)})"
+            for field, columns in RECORD_FIELDS.items()
+        }
+        self.select_sql = {
+            field: f"SELECT date, {', '.join(columns)} FROM {field} WHERE user = ? AND date BETWEEN ? AND ? ORDER BY id"
+            for field, columns in RECORD_FIELDS.items()
+        }
+
+    def close(self):
+        self.db.close()
+
+    def _row(self, field, name, entry):
+        return (name, entry["date"]) + tuple(entry.get(c) for c in RECORD_FIELDS[field])
+
+    def get_user(self, name):
+        row = self.db.execute("SELECT password, daily_goals FROM users WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        data = {field: self.records(name, field) for field in RECORD_FIELDS}
+        data["daily_goals"] = json.loads(row[1])
+        return {"password": row[0], "data": data}
+
+    def exists(self, name):
+        return self.db.execute("SELECT 1 FROM users WHERE name = ?", (name,)).fetchone() is not None
+
+    def put_user(self, name, password, data):
+        with self.db:
+            for field in RECORD_FIELDS:
+                self.db.execute(f"DELETE FROM {field} WHERE user = ?", (name,))
+            self.import_users({name: {"password": password, "data": data}})
+
+    def append(self, name, field, entry):
+        with self.db:
+            self.db.execute(self.insert_sql[field], self._row(field, name, entry))
+
+    def set_field(self, name, field, value):
+        if field != "daily_goals":
+            raise KeyError(field)
+        with self.db:
+            self.db.execute("UPDATE users SET daily_goals = ? WHERE name = ?", (json.dumps(value), name))
+
+    def records(self, name, field, since=None, until=None):
+        columns = ("date",) + RECORD_FIELDS[field]
+        rows = self.db.execute(self.select_sql[field], (name, since or "0000-01-01", until or "9999-12-31"))
+        return [dict(zip(columns, row)) for row in rows]
+
+    def load_all(self):
+        names = [row[0] for row in self.db.execute("SELECT name FROM users ORDER BY name")]
+        return {name: self.get_user(name) for name in names}
+
+    def save_all(self, users):
+        with self.db:
+            self.db.execute("DELETE FROM users")
+            for field in RECORD_FIELDS:
+                self.db.execute(f"DELETE FROM {field}")
+            self.import_users(users)
+
+    # bulk load in the caller's transaction; no per-user deletes
+    def import_users(self, users):
+        self.db.executemany(
+            "INSERT OR REPLACE INTO users (name, password, daily_goals) VALUES (?, ?, ?)",
+            ((name, u["password"], json.dumps(u["data"].get("daily_goals", default_goals()))) for name, u in users.items()),
+        )
+        for field in RECORD_FIELDS:
+            self.db.executemany(
+                self.insert_sql[field],
+                (self._row(field, name, e) for name, u in users.items() for e in u["data"].get(field, [])),
+            )
+
+# by extension: .db is SQLite, .json a single users.json, anything else a
+# sharded directory
+def open_path(path):
+    if path.endswith(".db"):
+        return SQLiteStorage(path)
+    if path.endswith(".json"):
+        return JsonStorage(path)
+    return ShardedStorage(path)
+
+# copies every user from one store into another; users already there with
+# the same name are replaced
+def migrate(src, dest):
+    source = open_path(src)
+    users = source.load_all()
+    source.close()
+    store = open_path(dest)
+    merged = store.load_all()
+    merged.update(users)
+    store.save_all(merged)
+    store.close()
+    return len(users)
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--rebalance"] and len(sys.argv) == 4:
+        store = ShardedStorage(sys.argv[2])
+        old = store.buckets
+        store.rebalance(int(sys.argv[3]))
+        print(f"{sys.argv[2]}: {old} -> {store.buckets} buckets")
+    elif len(sys.argv) == 3:
+        n = migrate(sys.argv[1], sys.argv[2])
+        print(f"imported {n} users into {sys.argv[2]}")
+    else:
+        sys.exit("usage: python3 storage.py SRC DEST | python3 storage.py --rebalance DIR BUCKETS")
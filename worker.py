@@ -0,0 +1,52 @@
+import sys
+import json
+
+import main
+
+# Resident diagnosis worker: one JSON request per line on stdin,
+# one JSON response per line on stdout. The model is fitted once at startup.
+
+def handle(req):
+    op = req.get("op")
+    if op == "add":
+        main.add_condition(req["condition"], req["symptoms"])
+        return {"id": req.get("id"), "ok": True}
+    if op == "remove":
+        main.remove_condition(req["condition"])
+        return {"id": req.get("id"), "ok": True}
+    if op == "stats":
+        return {"id": req.get("id"), "stats": main.cache_stats()}
+    if "inputs" in req:
+        return {"id": req.get("id"), "diagnoses": list(main.diagnose_batch(req["inputs"]))}
+    if "k" in req:
+        ranking = main.diagnose_top(req["input"], int(req["k"]))
+        return {"id": req.get("id"), "diagnosis": ranking[0][0] if ranking else None, "ranking": ranking}
+    return {"id": req.get("id"), "diagnosis": main.diagnose(req["input"])}
+
+def serve(inp, out):
+    for line in inp:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+            if not isinstance(req, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            resp = {"id": None, "error": f"bad request: {e}"}
+        else:
+            try:
+                resp = handle(req)
+            except Exception as e:
+                resp = {"id": req.get("id"), "error": str(e)}
+        out.write(json.dumps(resp) + "\n")
+        out.flush()
+
+def main_loop():
+    main.default_model()
+    sys.stderr.write("diagnosis worker ready\n")
+    sys.stderr.flush()
+    serve(sys.stdin, sys.stdout)
+
+if __name__ == "__main__":
+    main_loop()